@@ -15,22 +15,42 @@ This tool analyzes edit wars on Wikipedia, including:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
 import numpy as np
-from collections import Counter, defaultdict
+from collections import Counter
 import re
-from typing import Dict, List, Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Tuple, Optional
 import logging
 
+try:
+    import ciso8601  # Optional C parser for ISO-8601 timestamps
+except ImportError:
+    ciso8601 = None
+
+try:
+    import orjson  # Optional fast JSON encoder/decoder
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Edit summary keywords that mark a revision as a revert
+_REVERT_RE = re.compile(r'revert|undo|\brv\b|rollback|restore', re.IGNORECASE)
+
+def _parse_timestamp(timestamp: str) -> float:
+    """Convert a MediaWiki timestamp (e.g. '2024-01-01T12:00:00Z') to epoch seconds"""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(timestamp).timestamp()
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
 class EditWarAnalyzer:
     """Comprehensive edit war analysis tool"""
     
@@ -46,69 +66,149 @@ class EditWarAnalyzer:
         self.revert_threshold = 3  # Minimum reverts to consider it an edit war
         self.time_window_hours = 24  # Time window for edit war detection
         self.min_editors = 2  # Minimum unique editors for edit war
+        self.min_page_length = 3000  # Pages shorter than this (bytes) are skipped as stubs
+        
+        # Request concurrency and rate limiting
+        self.max_concurrent_requests = 8  # Pages analyzed in parallel
+        self.min_request_interval = 0.05  # Seconds between API requests (shared across threads)
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        
+        # Keep one pooled connection per worker and retry transient failures
+        # (rate limiting, server errors) with exponential backoff
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=('GET',), respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrent_requests, max_retries=retry)
+        self.session.mount('https://', adapter)
+        
+        # In-process revision cache: (title, limit) -> (fetch time, revisions)
+        self.cache_ttl = 300  # Seconds before cached revisions are re-fetched
+        self._revision_cache = {}
+    
+    def _get(self, params: Dict) -> requests.Response:
+        """Issue a rate-limited GET request against the MediaWiki API"""
+        with self._rate_lock:
+            wait = self._next_request_time - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_request_time = time.monotonic() + self.min_request_interval
+        return self.session.get(self.api_url, params=params)
+    
+    def _get_json(self, params: Dict) -> Dict:
+        """Issue a rate-limited API request and decode the JSON response"""
+        response = self._get(params)
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    @staticmethod
+    def _annotate_times(revisions: List[Dict]) -> List[Dict]:
+        """Parse each revision timestamp once and cache it as epoch seconds under '_ts'"""
+        for rev in revisions:
+            if '_ts' not in rev:
+                rev['_ts'] = _parse_timestamp(rev['timestamp'])
+        return revisions
+    
+    @classmethod
+    def _to_columns(cls, revisions: List[Dict]) -> Dict[str, np.ndarray]:
+        """Convert a list of revision dicts into column arrays, one per field"""
+        cls._annotate_times(revisions)
+        n = len(revisions)
+        return {
+            'ts': np.fromiter((rev['_ts'] for rev in revisions), dtype=np.float64, count=n),
+            'size': np.fromiter((rev.get('size', 0) for rev in revisions), dtype=np.int64, count=n),
+            'has_size': np.fromiter(('size' in rev for rev in revisions), dtype=bool, count=n),
+            'user': np.array([rev.get('user', 'Anonymous') for rev in revisions], dtype=object),
+            'revid': np.fromiter((rev.get('revid', -1) for rev in revisions), dtype=np.int64, count=n)
+        }
     
     def get_page_revisions(self, page_title: str, limit: int = 1000) -> List[Dict]:
-        """Get detailed revision history for a page"""
+        """Get detailed revision history for a page, served from cache while fresh"""
+        key = (page_title, limit)
+        cached = self._revision_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+        
+        revisions = self._fetch_page_revisions(page_title, limit)
+        if revisions:
+            self._revision_cache[key] = (time.monotonic(), revisions)
+        return list(revisions)
+    
+    def _fetch_page_revisions(self, page_title: str, limit: int) -> List[Dict]:
+        """Fetch revision history for a page from the API"""
         logger.info(f"Fetching revisions for: {page_title}")
         
-        revisions = []
+        revisions = list(self.iter_page_revisions(page_title, limit))
+        logger.info(f"Retrieved {len(revisions)} revisions")
+        
+        return revisions
+    
+    def iter_page_revisions(self, page_title: str, limit: int = 1000) -> Iterator[Dict]:
+        """Yield up to `limit` revisions oldest-first, following rvcontinue across API pages"""
         params = {
             'action': 'query',
             'format': 'json',
             'prop': 'revisions',
             'titles': page_title,
-            'rvprop': 'timestamp|user|comment|size|tags|revid|parentid',
-            'rvlimit': min(limit, 500),
+            'rvprop': 'timestamp|user|comment|size|ids',
             'rvdir': 'newer'
         }
         
-        try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+        fetched = 0
+        while fetched < limit:
+            params['rvlimit'] = min(limit - fetched, 500)  # API limit is 500 per request
+            
+            try:
+                data = self._get_json(params)
+            except Exception as e:
+                logger.error(f"Error fetching revisions: {e}")
+                return
             
             if 'query' in data and 'pages' in data['query']:
                 page_id = list(data['query']['pages'].keys())[0]
                 if page_id != '-1':
                     page_data = data['query']['pages'][page_id]
-                    if 'revisions' in page_data:
-                        revisions = page_data['revisions']
-                        logger.info(f"Retrieved {len(revisions)} revisions")
-        except Exception as e:
-            logger.error(f"Error fetching revisions: {e}")
-        
-        return revisions
+                    for rev in page_data.get('revisions', []):
+                        yield rev
+                        fetched += 1
+            
+            if 'continue' not in data:
+                return
+            params.update(data['continue'])
     
-    def detect_reverts(self, revisions: List[Dict]) -> List[Dict]:
+    def detect_reverts(self, revisions: List[Dict], columns: Optional[Dict[str, np.ndarray]] = None) -> List[Dict]:
         """Detect reverts in revision history"""
         reverts = []
+        if len(revisions) < 2:
+            return reverts
+        if columns is None:
+            columns = self._to_columns(revisions)
+        
+        # Check if this is a revert (size similar to earlier revision)
+        has_size = columns['has_size']
+        sizes = columns['size']
+        size_ratio = np.abs(np.diff(sizes)) / np.maximum(sizes[1:], 1)
         
-        for i in range(1, len(revisions)):
+        # Look for size patterns that suggest reverts (size change less than 10%)
+        size_mask = has_size[1:] & has_size[:-1] & (size_ratio < 0.1)
+        
+        # Only scan comments of revisions that passed the size check
+        for i in np.flatnonzero(size_mask) + 1:
             current_rev = revisions[i]
             previous_rev = revisions[i-1]
             
-            # Check if this is a revert (size similar to earlier revision)
-            if 'size' in current_rev and 'size' in previous_rev:
-                size_diff = abs(current_rev['size'] - previous_rev['size'])
-                size_ratio = size_diff / max(current_rev['size'], 1)
-                
-                # Look for size patterns that suggest reverts
-                if size_ratio < 0.1:  # Size change less than 10%
-                    # Check if comment indicates revert
-                    comment = current_rev.get('comment', '').lower()
-                    revert_indicators = ['revert', 'undo', 'rv', 'rollback', 'restore']
-                    
-                    is_revert = any(indicator in comment for indicator in revert_indicators)
-                    
-                    if is_revert:
-                        reverts.append({
-                            'timestamp': current_rev['timestamp'],
-                            'user': current_rev.get('user', 'Anonymous'),
-                            'comment': current_rev.get('comment', ''),
-                            'size': current_rev['size'],
-                            'revid': current_rev['revid'],
-                            'parentid': current_rev.get('parentid'),
-                            'reverted_to_size': previous_rev['size']
-                        })
+            # Check if comment indicates revert
+            if _REVERT_RE.search(current_rev.get('comment', '')):
+                reverts.append({
+                    'timestamp': current_rev['timestamp'],
+                    '_ts': current_rev['_ts'],
+                    'user': current_rev.get('user', 'Anonymous'),
+                    'comment': current_rev.get('comment', ''),
+                    'size': current_rev['size'],
+                    'revid': current_rev['revid'],
+                    'parentid': current_rev.get('parentid'),
+                    'reverted_to_size': previous_rev['size']
+                })
         
         return reverts
     
@@ -118,11 +218,18 @@ class EditWarAnalyzer:
         
         # Get revisions
         revisions = self.get_page_revisions(page_title, limit=1000)
+        return self.analyze_revisions(page_title, revisions)
+    
+    def analyze_revisions(self, page_title: str, revisions: List[Dict]) -> Dict:
+        """Detect edit wars in an already fetched revision history"""
         if not revisions:
             return {}
         
+        # Lay the revisions out column-wise once for all downstream checks
+        columns = self._to_columns(revisions)
+        
         # Detect reverts
-        reverts = self.detect_reverts(revisions)
+        reverts = self.detect_reverts(revisions, columns)
         
         # Analyze revert patterns
         edit_war_data = {
@@ -147,10 +254,10 @@ class EditWarAnalyzer:
                     edit_war_data['edit_wars'].append(war_data)
         
         # Analyze editor participation
-        edit_war_data['editor_participation'] = self._analyze_editor_participation(revisions, reverts)
+        edit_war_data['editor_participation'] = self._analyze_editor_participation(columns, reverts)
         
         # Check for 3-revert rule violations
-        edit_war_data['three_revert_violations'] = self._detect_three_revert_violations(revisions)
+        edit_war_data['three_revert_violations'] = self._detect_three_revert_violations(revisions, columns)
         
         return edit_war_data
     
@@ -159,43 +266,26 @@ class EditWarAnalyzer:
         if not reverts:
             return []
         
-        groups = []
-        current_group = [reverts[0]]
+        # A new group starts wherever the gap to the previous revert exceeds the window
+        ts = np.fromiter((revert['_ts'] for revert in reverts), dtype=np.float64, count=len(reverts))
+        breaks = np.flatnonzero(np.diff(ts) / 3600.0 > self.time_window_hours) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [len(reverts)]))
         
-        for i in range(1, len(reverts)):
-            current_time = datetime.fromisoformat(reverts[i]['timestamp'].replace('Z', '+00:00'))
-            prev_time = datetime.fromisoformat(reverts[i-1]['timestamp'].replace('Z', '+00:00'))
-            
-            time_diff = (current_time - prev_time).total_seconds() / 3600  # hours
-            
-            if time_diff <= self.time_window_hours:
-                current_group.append(reverts[i])
-            else:
-                if len(current_group) >= self.revert_threshold:
-                    groups.append(current_group)
-                current_group = [reverts[i]]
-        
-        if len(current_group) >= self.revert_threshold:
-            groups.append(current_group)
-        
-        return groups
+        return [reverts[start:end] for start, end in zip(starts, ends)
+                if end - start >= self.revert_threshold]
     
     def _analyze_edit_war_group(self, revert_group: List[Dict], all_revisions: List[Dict]) -> Dict:
         """Analyze a specific edit war group"""
-        start_time = datetime.fromisoformat(revert_group[0]['timestamp'].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(revert_group[-1]['timestamp'].replace('Z', '+00:00'))
-        duration = (end_time - start_time).total_seconds() / 3600  # hours
+        duration = (revert_group[-1]['_ts'] - revert_group[0]['_ts']) / 3600.0  # hours
         
         editors = [revert['user'] for revert in revert_group]
         unique_editors = list(set(editors))
         
-        # Calculate revert intervals
-        intervals = []
-        for i in range(1, len(revert_group)):
-            current_time = datetime.fromisoformat(revert_group[i]['timestamp'].replace('Z', '+00:00'))
-            prev_time = datetime.fromisoformat(revert_group[i-1]['timestamp'].replace('Z', '+00:00'))
-            interval = (current_time - prev_time).total_seconds() / 60  # minutes
-            intervals.append(interval)
+        # Calculate revert intervals (minutes) from the cached epochs in one diff
+        ts = np.fromiter((revert['_ts'] for revert in revert_group), dtype=np.float64, count=len(revert_group))
+        intervals = np.diff(ts) / 60.0
+        has_intervals = intervals.size > 0
         
         return {
             'start_time': revert_group[0]['timestamp'],
@@ -204,114 +294,136 @@ class EditWarAnalyzer:
             'revert_count': len(revert_group),
             'unique_editors': len(unique_editors),
             'editors': unique_editors,
-            'avg_interval_minutes': np.mean(intervals) if intervals else 0,
-            'median_interval_minutes': np.median(intervals) if intervals else 0,
-            'min_interval_minutes': min(intervals) if intervals else 0,
-            'max_interval_minutes': max(intervals) if intervals else 0
+            'avg_interval_minutes': float(intervals.mean()) if has_intervals else 0,
+            'median_interval_minutes': float(np.median(intervals)) if has_intervals else 0,
+            'min_interval_minutes': float(intervals.min()) if has_intervals else 0,
+            'max_interval_minutes': float(intervals.max()) if has_intervals else 0
         }
     
-    def _analyze_editor_participation(self, revisions: List[Dict], reverts: List[Dict]) -> Dict:
+    def _analyze_editor_participation(self, columns: Dict[str, np.ndarray], reverts: List[Dict]) -> Dict:
         """Analyze editor participation patterns"""
-        # Count edits per editor
-        editor_edits = Counter()
-        editor_reverts = Counter()
-        
-        for rev in revisions:
-            editor = rev.get('user', 'Anonymous')
-            editor_edits[editor] += 1
-        
-        for revert in reverts:
-            editor = revert.get('user', 'Anonymous')
-            editor_reverts[editor] += 1
+        # Count edits and reverts per editor, keeping editors in order of first appearance
+        editors, first_index, editor_ids, edit_counts = np.unique(
+            columns['user'], return_index=True, return_inverse=True, return_counts=True
+        )
+        is_revert = np.isin(columns['revid'], [revert['revid'] for revert in reverts])
+        revert_counts = np.bincount(editor_ids, weights=is_revert, minlength=len(editors)).astype(np.int64)
         
         # Calculate editor experience (based on edit count)
-        total_edits = sum(editor_edits.values())
+        total_edits = len(editor_ids)
         editor_experience = {}
+        level_counts = Counter()
         
-        for editor, edit_count in editor_edits.items():
+        for j in np.argsort(first_index):
+            edit_count = int(edit_counts[j])
             experience_level = 'new' if edit_count < 10 else 'intermediate' if edit_count < 100 else 'veteran'
-            editor_experience[editor] = {
+            level_counts[experience_level] += 1
+            editor_experience[editors[j]] = {
                 'total_edits': edit_count,
-                'reverts': editor_reverts.get(editor, 0),
+                'reverts': int(revert_counts[j]),
                 'experience_level': experience_level,
                 'edit_percentage': (edit_count / total_edits) * 100 if total_edits > 0 else 0
             }
         
         return {
-            'total_editors': len(editor_edits),
+            'total_editors': len(editors),
             'editor_breakdown': editor_experience,
-            'new_editors': len([e for e in editor_experience.values() if e['experience_level'] == 'new']),
-            'intermediate_editors': len([e for e in editor_experience.values() if e['experience_level'] == 'intermediate']),
-            'veteran_editors': len([e for e in editor_experience.values() if e['experience_level'] == 'veteran'])
+            'new_editors': level_counts['new'],
+            'intermediate_editors': level_counts['intermediate'],
+            'veteran_editors': level_counts['veteran']
         }
     
-    def _detect_three_revert_violations(self, revisions: List[Dict]) -> List[Dict]:
+    def _detect_three_revert_violations(self, revisions: List[Dict],
+                                        columns: Optional[Dict[str, np.ndarray]] = None) -> List[Dict]:
         """Detect violations of the 3-revert rule"""
         violations = []
+        if len(revisions) < 4:  # Need at least 4 edits to have 3 reverts
+            return violations
+        if columns is None:
+            columns = self._to_columns(revisions)
+        
+        # Sort revisions by user, then by time, so each user's edits are contiguous
+        editors, first_index, editor_ids = np.unique(columns['user'], return_index=True, return_inverse=True)
+        order = np.lexsort((columns['ts'], editor_ids))
+        ids = editor_ids[order]
+        ts = columns['ts'][order]
+        sizes = columns['size'][order]
+        has_size = columns['has_size'][order]
+        
+        # Edit k counts as a revert when it follows the same user's previous edit
+        # with only a small size change
+        same_user = ids[1:] == ids[:-1]
+        size_close = same_user & has_size[1:] & has_size[:-1] & (np.abs(np.diff(sizes)) < 100)
+        is_revert = np.concatenate(([False], size_close))
+        cumulative = np.concatenate(([0], np.cumsum(is_revert)))
+        
+        # Offset each user's timestamps by a gap wider than 24 hours so one sorted key
+        # array can be windowed with searchsorted without crossing between users
+        window_s = 24 * 3600
+        span = ts.max() - ts.min() + 2 * window_s
+        keys = ids * span + (ts - ts.min())
+        window_starts = np.searchsorted(keys, keys - window_s, side='left')
+        
+        # Reverts inside the 24-hour window ending at each edit
+        window_counts = cumulative[1:] - cumulative[window_starts + 1]
+        
+        # Keep the first edit per user at which 3 reverts fall within 24 hours
+        hits = np.flatnonzero(window_counts >= 3)
+        hit_users, first_hit = np.unique(ids[hits], return_index=True)
+        
+        for user_id, k in sorted(zip(hit_users, hits[first_hit]), key=lambda x: first_index[x[0]]):
+            violations.append({
+                'user': editors[user_id],
+                'timestamp': revisions[order[k]]['timestamp'],
+                'revert_count': int(window_counts[k]),
+                'time_window_hours': float((ts[k] - ts[window_starts[k]]) / 3600.0)
+            })
         
-        # Group revisions by user and check for rapid reverts
-        user_revisions = defaultdict(list)
-        
-        for rev in revisions:
-            user = rev.get('user', 'Anonymous')
-            user_revisions[user].append(rev)
-        
-        for user, user_revs in user_revisions.items():
-            if len(user_revs) >= 4:  # Need at least 4 edits to have 3 reverts
-                # Check for rapid reverts (within 24 hours)
-                user_revs.sort(key=lambda x: x['timestamp'])
+        return violations
+    
+    def get_pages_info_batch(self, titles: List[str], inprop: str = 'protection') -> Dict[str, Dict]:
+        """Get page info for many titles, batching up to 50 titles per API request"""
+        pages_info = {}
+        
+        for start in range(0, len(titles), 50):
+            params = {
+                'action': 'query',
+                'format': 'json',
+                'prop': 'info',
+                'titles': '|'.join(titles[start:start + 50]),
+                'inprop': inprop
+            }
+            
+            try:
+                data = self._get_json(params)
                 
-                revert_count = 0
-                for i in range(1, len(user_revs)):
-                    current_time = datetime.fromisoformat(user_revs[i]['timestamp'].replace('Z', '+00:00'))
-                    prev_time = datetime.fromisoformat(user_revs[i-1]['timestamp'].replace('Z', '+00:00'))
-                    
-                    time_diff = (current_time - prev_time).total_seconds() / 3600
-                    
-                    # Check if this looks like a revert
-                    if 'size' in user_revs[i] and 'size' in user_revs[i-1]:
-                        size_diff = abs(user_revs[i]['size'] - user_revs[i-1]['size'])
-                        if size_diff < 100:  # Small size change suggests revert
-                            revert_count += 1
-                    
-                    if time_diff <= 24 and revert_count >= 3:
-                        violations.append({
-                            'user': user,
-                            'timestamp': user_revs[i]['timestamp'],
-                            'revert_count': revert_count,
-                            'time_window_hours': time_diff
-                        })
-                        break
+                if 'query' in data and 'pages' in data['query']:
+                    # Map normalized titles back to the titles that were requested
+                    normalized = {n['to']: n['from'] for n in data['query'].get('normalized', [])}
+                    for page_data in data['query']['pages'].values():
+                        title = normalized.get(page_data['title'], page_data['title'])
+                        pages_info[title] = page_data
+            except Exception as e:
+                logger.error(f"Error fetching page info batch: {e}")
+        
+        return pages_info
+    
+    @staticmethod
+    def _protection_from_info(page_data: Optional[Dict]) -> Dict:
+        """Build a protection status record from a prop=info page entry"""
+        if not page_data or 'missing' in page_data or 'invalid' in page_data:
+            return {'protected': False, 'protection_level': [], 'page_id': None}
         
-        return violations
+        return {
+            'protected': 'protection' in page_data,
+            'protection_level': page_data.get('protection', []),
+            'page_id': str(page_data['pageid'])
+        }
     
     def get_page_protection_status(self, page_title: str) -> Dict:
         """Get page protection status"""
-        params = {
-            'action': 'query',
-            'format': 'json',
-            'prop': 'info',
-            'titles': page_title,
-            'inprop': 'protection'
-        }
-        
-        try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
-            
-            if 'query' in data and 'pages' in data['query']:
-                page_id = list(data['query']['pages'].keys())[0]
-                if page_id != '-1':
-                    page_data = data['query']['pages'][page_id]
-                    return {
-                        'protected': 'protection' in page_data,
-                        'protection_level': page_data.get('protection', []),
-                        'page_id': page_id
-                    }
-        except Exception as e:
-            logger.error(f"Error getting protection status: {e}")
-        
-        return {'protected': False, 'protection_level': [], 'page_id': None}
+        page_info = self.get_pages_info_batch([page_title], inprop='protection')
+        return self._protection_from_info(page_info.get(page_title))
     
     def get_talk_page_activity(self, page_title: str) -> Dict:
         """Get talk page activity for a page"""
@@ -324,11 +436,9 @@ class EditWarAnalyzer:
             return {'has_talk_page': False, 'activity_level': 'none'}
         
         # Analyze talk page activity
-        recent_activity = 0
-        for rev in talk_revisions[-10:]:  # Last 10 revisions
-            rev_time = datetime.fromisoformat(rev['timestamp'].replace('Z', '+00:00'))
-            if (datetime.now().replace(tzinfo=None) - rev_time.replace(tzinfo=None)).days <= 30:
-                recent_activity += 1
+        cutoff = time.time() - 30 * 86400  # 30 days ago, in epoch seconds
+        recent_activity = sum(1 for rev in self._annotate_times(talk_revisions[-10:])  # Last 10 revisions
+                              if rev['_ts'] >= cutoff)
         
         activity_level = 'high' if recent_activity >= 5 else 'medium' if recent_activity >= 2 else 'low'
         
@@ -340,6 +450,12 @@ class EditWarAnalyzer:
             'last_edit': talk_revisions[-1]['timestamp'] if talk_revisions else None
         }
     
+    def _get_talk_activity_from_info(self, title: str, page_info: Optional[Dict]) -> Dict:
+        """Get talk page activity, skipping the fetch when page info shows no talk page"""
+        if page_info is not None and 'talkid' not in page_info:
+            return {'has_talk_page': False, 'activity_level': 'none'}
+        return self.get_talk_page_activity(title)
+    
     def find_contested_articles(self, limit: int = 50) -> List[Dict]:
         """Find articles with high edit war potential"""
         logger.info(f"Searching for contested articles...")
@@ -357,24 +473,49 @@ class EditWarAnalyzer:
         }
         
         try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'random' in data['query']:
-                pages = data['query']['random']
+                titles = [page['title'] for page in data['query']['random']]
                 
-                for page in pages:
-                    title = page['title']
-                    logger.info(f"Analyzing: {title}")
-                    
-                    # Get edit war data
-                    edit_war_data = self.detect_edit_wars(title)
+                # Fetch page info for all pages up front, 50 titles per request
+                pages_info = self.get_pages_info_batch(titles, inprop='protection|talkid')
+                
+                # Skip stubs before the expensive revision fetch; keep pages with no info
+                candidates = [title for title in titles
+                              if pages_info.get(title, {}).get('length', self.min_page_length) >= self.min_page_length]
+                logger.info(f"Skipping {len(titles) - len(candidates)} of {len(titles)} pages as stubs")
+                
+                titles = candidates
+                
+                # Fetch revisions on the pool and analyze each page on this thread as soon
+                # as it arrives; talk page fetches for contested pages go back to the pool
+                with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+                    revision_futures = {executor.submit(self.get_page_revisions, title, 1000): title
+                                        for title in titles}
+                    talk_futures = {}
                     
-                    if edit_war_data.get('edit_wars'):
-                        # Get additional data
-                        protection_status = self.get_page_protection_status(title)
-                        talk_activity = self.get_talk_page_activity(title)
+                    for future in as_completed(revision_futures):
+                        title = revision_futures[future]
+                        logger.info(f"Analyzing: {title}")
+                        
+                        try:
+                            edit_war_data = self.analyze_revisions(title, future.result())
+                        except Exception as e:
+                            logger.error(f"Error analyzing {title}: {e}")
+                            continue
+                        
+                        if not edit_war_data.get('edit_wars'):
+                            continue
+                        
+                        # Reuse batched page info for protection status when available
+                        page_info = pages_info.get(title)
+                        if page_info is not None:
+                            protection_status = self._protection_from_info(page_info)
+                        else:
+                            protection_status = self.get_page_protection_status(title)
                         
+                        talk_futures[title] = executor.submit(self._get_talk_activity_from_info, title, page_info)
                         contested_articles.append({
                             'title': title,
                             'edit_wars': edit_war_data['edit_wars'],
@@ -383,10 +524,11 @@ class EditWarAnalyzer:
                             'editor_participation': edit_war_data['editor_participation'],
                             'three_revert_violations': edit_war_data['three_revert_violations'],
                             'protected': protection_status['protected'],
-                            'talk_activity': talk_activity
+                            'talk_activity': None
                         })
                     
-                    time.sleep(0.1)  # Be respectful to the API
+                    for article in contested_articles:
+                        article['talk_activity'] = talk_futures[article['title']].result()
         
         except Exception as e:
             logger.error(f"Error finding contested articles: {e}")
@@ -474,15 +616,29 @@ class EditWarAnalyzer:
         if filename is None:
             filename = f"edit_war_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                     orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Edit war report saved to {filename}")
         return filename
     
+    @staticmethod
+    def _plot_histogram(ax, values: np.ndarray, bins):
+        """Bin values with np.histogram and draw the counts as bars"""
+        counts, edges = np.histogram(values, bins=bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, edgecolor='black')
+    
     def create_visualizations(self, report: Dict, output_dir: str = "edit_war_analysis"):
         """Create visualizations for edit war analysis"""
         import os
+        # Plotting libraries are only needed here; keep them off the report path
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         os.makedirs(output_dir, exist_ok=True)
         
         if not report['contested_articles']:
@@ -495,50 +651,47 @@ class EditWarAnalyzer:
         
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
         
+        articles = report['contested_articles']
+        wars = [war for article in articles for war in article['edit_wars']]
+        
+        # Build each metric as an array once and bin it with NumPy
+        revert_rates = np.fromiter((article['revert_rate'] for article in articles),
+                                   dtype=np.float64, count=len(articles))
+        durations = np.fromiter((war['duration_hours'] for war in wars), dtype=np.float64, count=len(wars))
+        editor_counts = np.fromiter((len(war['editors']) for war in wars), dtype=np.int64, count=len(wars))
+        intervals = np.fromiter((war['avg_interval_minutes'] for war in wars), dtype=np.float64, count=len(wars))
+        
         # 1. Revert rate distribution
-        revert_rates = [article['revert_rate'] for article in report['contested_articles']]
-        axes[0, 0].hist(revert_rates, bins=20, alpha=0.7, edgecolor='black')
+        self._plot_histogram(axes[0, 0], revert_rates, bins=20)
         axes[0, 0].set_title('Distribution of Revert Rates')
         axes[0, 0].set_xlabel('Revert Rate')
         axes[0, 0].set_ylabel('Number of Articles')
         
         # 2. Edit war duration
-        durations = []
-        for article in report['contested_articles']:
-            for war in article['edit_wars']:
-                durations.append(war['duration_hours'])
-        
-        if durations:
-            axes[0, 1].hist(durations, bins=20, alpha=0.7, edgecolor='black')
+        if durations.size:
+            self._plot_histogram(axes[0, 1], durations, bins=20)
             axes[0, 1].set_title('Edit War Duration Distribution')
             axes[0, 1].set_xlabel('Duration (hours)')
             axes[0, 1].set_ylabel('Number of Edit Wars')
         
         # 3. Editor participation
-        editor_counts = [len(war['editors']) for article in report['contested_articles'] 
-                        for war in article['edit_wars']]
-        if editor_counts:
-            axes[0, 2].hist(editor_counts, bins=range(min(editor_counts), max(editor_counts) + 2), 
-                           alpha=0.7, edgecolor='black')
+        if editor_counts.size:
+            self._plot_histogram(axes[0, 2], editor_counts,
+                                 bins=np.arange(editor_counts.min(), editor_counts.max() + 2))
             axes[0, 2].set_title('Editor Participation in Edit Wars')
             axes[0, 2].set_xlabel('Number of Unique Editors')
             axes[0, 2].set_ylabel('Number of Edit Wars')
         
         # 4. Revert intervals
-        intervals = []
-        for article in report['contested_articles']:
-            for war in article['edit_wars']:
-                intervals.append(war['avg_interval_minutes'])
-        
-        if intervals:
-            axes[1, 0].hist(intervals, bins=20, alpha=0.7, edgecolor='black')
+        if intervals.size:
+            self._plot_histogram(axes[1, 0], intervals, bins=20)
             axes[1, 0].set_title('Average Revert Intervals')
             axes[1, 0].set_xlabel('Interval (minutes)')
             axes[1, 0].set_ylabel('Number of Edit Wars')
         
         # 5. Protection status
-        protected_count = sum(1 for article in report['contested_articles'] if article['protected'])
-        unprotected_count = len(report['contested_articles']) - protected_count
+        protected_count = sum(1 for article in articles if article['protected'])
+        unprotected_count = len(articles) - protected_count
         
         axes[1, 1].pie([protected_count, unprotected_count], 
                       labels=['Protected', 'Unprotected'], 
@@ -546,8 +699,7 @@ class EditWarAnalyzer:
         axes[1, 1].set_title('Page Protection Status')
         
         # 6. Talk page activity
-        talk_levels = [article['talk_activity']['activity_level'] 
-                      for article in report['contested_articles']]
+        talk_levels = [article['talk_activity']['activity_level'] for article in articles]
         talk_counts = Counter(talk_levels)
         
         if talk_counts:
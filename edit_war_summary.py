@@ -8,19 +8,104 @@ by analyzing known controversial pages and patterns.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import sys
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import numpy as np
 from collections import Counter, defaultdict
 import re
+import sqlite3
+import threading
+
+try:
+    import requests_cache  # Optional on-disk cache for API responses
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # Optional fast JSON decoder
+except ImportError:
+    orjson = None
+
+try:
+    import ciso8601  # Optional C parser for ISO-8601 timestamps
+except ImportError:
+    ciso8601 = None
+
+def _parse_timestamp(timestamp: str) -> float:
+    """Convert a MediaWiki timestamp (e.g. '2024-01-01T12:00:00Z') to epoch seconds"""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(timestamp).timestamp()
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+def _retry_after_seconds(response, default: int = 5) -> float:
+    """Read Retry-After as delay-seconds or an HTTP-date, falling back to the default"""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+def _group_reverts(ts, min_group: int = 3, window_hours: float = 24.0):
+    """Split sorted revert epochs into bursts separated by gaps longer than the window.
+    
+    Returns (starts, ends, durations_h, avg_intervals_min) for bursts of at least
+    min_group reverts; ends are exclusive indices into ts.
+    """
+    breaks = np.flatnonzero(np.diff(ts) > window_hours * 3600) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(ts)]))
+    keep = ends - starts >= min_group
+    starts, ends = starts[keep], ends[keep]
+    
+    durations_h = (ts[ends - 1] - ts[starts]) / 3600
+    # Consecutive gaps telescope, so their mean is the span over the gap count
+    avg_intervals_min = durations_h * 60 / np.maximum(ends - starts - 1, 1)
+    return starts, ends, durations_h, avg_intervals_min
 
 class EditWarSummary:
+    # Edit summary keywords that mark a revision as a revert
+    _REVERT_RE = re.compile(r'revert|undo|\brv\b|rollback|restore', re.IGNORECASE)
+    
     def __init__(self):
         self.api_url = "https://en.wikipedia.org/w/api.php"
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Revisions and protection change slowly; reruns within 6 hours skip the network
+            # API errors (e.g. ratelimited) also come back as 200s, so skip anything flagged with an error header
+            self.session = requests_cache.CachedSession('editwar_cache', backend='sqlite',
+                                                        expire_after=timedelta(hours=6),
+                                                        allowable_codes=(200,),
+                                                        filter_fn=lambda r: 'MediaWiki-API-Error' not in r.headers)
+            self.session.cache.delete(expired=True)
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'EditWarSummary/1.0 (Educational Research Project)'
         })
+        # Local store of fetched revisions so reruns only request what is new
+        self.db = sqlite3.connect('editwar.db', check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self.db:
+            self.db.execute('CREATE TABLE IF NOT EXISTS pages '
+                            '(title TEXT PRIMARY KEY, last_ts TEXT, revisions BLOB)')
+        
+        self.max_workers = 8  # Pages analyzed concurrently; stay well under ~10 to avoid API errors
+        
+        # Reuse pooled keep-alive connections across threads and retry throttled or failed requests
+        retry = Retry(total=5, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True, allowed_methods=["GET"])
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry))
         
         # Known controversial pages for analysis
         self.controversial_pages = [
@@ -41,54 +126,100 @@ class EditWarSummary:
             "Russia"
         ]
     
+    def _get_json(self, params, max_attempts: int = 3):
+        """GET an API query, waiting out 'ratelimited'/'readonly' errors returned with HTTP 200"""
+        for attempt in range(max_attempts):
+            response = self.session.get(self.api_url, params=params)
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            
+            error_code = data.get('error', {}).get('code')
+            if error_code not in ('ratelimited', 'readonly') or attempt == max_attempts - 1:
+                return data
+            time.sleep(_retry_after_seconds(response))
+    
+    def _load_stored_revisions(self, page_title: str):
+        """Return (last_ts, revisions) previously stored for a page"""
+        with self._db_lock:
+            row = self.db.execute('SELECT last_ts, revisions FROM pages WHERE title = ?',
+                                  (page_title,)).fetchone()
+        if row is None:
+            return None, []
+        return row[0], orjson.loads(row[1]) if orjson is not None else json.loads(row[1])
+    
+    def _store_revisions(self, page_title: str, revisions):
+        """Persist a page's revisions along with the newest timestamp seen"""
+        blob = orjson.dumps(revisions) if orjson is not None else json.dumps(revisions).encode('utf-8')
+        with self._db_lock, self.db:
+            self.db.execute('INSERT OR REPLACE INTO pages (title, last_ts, revisions) VALUES (?, ?, ?)',
+                            (page_title, revisions[-1]['timestamp'], blob))
+    
     def get_page_revisions(self, page_title: str, limit: int = 500):
-        """Get page revisions"""
+        """Get page revisions, fetching only those newer than the stored copy"""
+        last_ts, stored = self._load_stored_revisions(page_title)
+        
+        # Revisions are listed oldest first, so a full stored window never changes
+        if len(stored) >= limit:
+            return stored[:limit]
+        
         params = {
             'action': 'query',
             'format': 'json',
             'prop': 'revisions',
             'titles': page_title,
-            'rvprop': 'timestamp|user|comment|size|tags',
+            'rvprop': 'ids|timestamp|user|comment|size|tags',
             'rvlimit': min(limit, 500),
             'rvdir': 'newer'
         }
+        if last_ts:
+            params['rvstart'] = last_ts
         
         try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'pages' in data['query']:
                 page_id = list(data['query']['pages'].keys())[0]
                 if page_id != '-1':
                     page_data = data['query']['pages'][page_id]
                     if 'revisions' in page_data:
-                        return page_data['revisions']
+                        # rvstart is inclusive, so drop revisions already stored
+                        seen = {rev.get('revid') for rev in stored}
+                        new_revisions = [rev for rev in page_data['revisions'] if rev.get('revid') not in seen]
+                        if new_revisions:
+                            stored = stored + new_revisions
+                            self._store_revisions(page_title, stored)
         except Exception as e:
             print(f"Error fetching revisions for {page_title}: {e}")
         
-        return []
+        return stored[:limit]
     
-    def detect_reverts(self, revisions):
-        """Detect reverts in revision history"""
-        reverts = []
-        
-        for i in range(1, len(revisions)):
-            current_rev = revisions[i]
-            previous_rev = revisions[i-1]
-            
-            # Check for revert indicators
-            comment = current_rev.get('comment', '').lower()
-            revert_indicators = ['revert', 'undo', 'rv', 'rollback', 'restore', 'reverted']
-            
-            if any(indicator in comment for indicator in revert_indicators):
-                reverts.append({
-                    'timestamp': current_rev['timestamp'],
-                    'user': current_rev.get('user', 'Anonymous'),
-                    'comment': current_rev.get('comment', ''),
-                    'size': current_rev.get('size', 0)
-                })
-        
-        return reverts
+    @staticmethod
+    def _to_columns(revisions):
+        """Decode revision dicts once into parallel per-field arrays"""
+        return {
+            'timestamp': [r['timestamp'] for r in revisions],
+            'user': np.array([r.get('user', 'Anonymous') for r in revisions], dtype=object),
+            'comment': [r.get('comment') or '' for r in revisions]
+        }
+    
+    def detect_reverts(self, revisions, columns=None):
+        """Detect reverts in revision history, returned as per-field arrays"""
+        if columns is None:
+            columns = self._to_columns(revisions)
+        
+        # Check for revert indicators, skipping the many empty bot/minor-edit comments;
+        # the first revision has nothing to revert
+        search = self._REVERT_RE.search
+        mask = np.fromiter((bool(c) and search(c) is not None for c in columns['comment']),
+                           dtype=bool, count=len(revisions))
+        mask[:1] = False
+        
+        # Parse each revert's timestamp to epoch seconds exactly once
+        timestamps = [columns['timestamp'][i] for i in np.flatnonzero(mask)]
+        return {
+            'timestamp': timestamps,
+            'ts': np.fromiter((_parse_timestamp(t) for t in timestamps), dtype=np.float64, count=len(timestamps)),
+            'user': columns['user'][mask]
+        }
     
     def analyze_edit_war_patterns(self, page_title: str):
         """Analyze edit war patterns for a page"""
@@ -99,67 +230,40 @@ class EditWarSummary:
             return None
         
         reverts = self.detect_reverts(revisions)
+        revert_times = reverts['ts']
         
-        if len(reverts) < 3:
+        if len(revert_times) < 3:
             return None
         
-        # Group reverts by time windows
-        revert_times = [datetime.fromisoformat(r['timestamp'].replace('Z', '+00:00')) for r in reverts]
-        revert_users = [r['user'] for r in reverts]
-        
-        # Group reverts within 24 hours
-        revert_groups = []
-        current_group = [reverts[0]]
+        # Group reverts within 24 hours of each other
+        starts, ends, durations, avg_intervals = _group_reverts(revert_times)
         
-        for i in range(1, len(reverts)):
-            time_diff = (revert_times[i] - revert_times[i-1]).total_seconds() / 3600
-            if time_diff <= 24:
-                current_group.append(reverts[i])
-            else:
-                if len(current_group) >= 3:
-                    revert_groups.append(current_group)
-                current_group = [reverts[i]]
-        
-        if len(current_group) >= 3:
-            revert_groups.append(current_group)
-        
-        if not revert_groups:
+        if not starts.size:
             return None
         
         # Analyze each edit war group
         edit_wars = []
-        for group in revert_groups:
-            start_time = datetime.fromisoformat(group[0]['timestamp'].replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(group[-1]['timestamp'].replace('Z', '+00:00'))
-            duration = (end_time - start_time).total_seconds() / 3600
-            
-            users = list(set([r['user'] for r in group]))
-            
-            # Calculate intervals
-            intervals = []
-            for i in range(1, len(group)):
-                current_time = datetime.fromisoformat(group[i]['timestamp'].replace('Z', '+00:00'))
-                prev_time = datetime.fromisoformat(group[i-1]['timestamp'].replace('Z', '+00:00'))
-                interval = (current_time - prev_time).total_seconds() / 60
-                intervals.append(interval)
+        for start, end, duration, avg_interval in zip(starts, ends, durations, avg_intervals):
+            # Sorted so the detailed examples list editors in a stable order
+            users = sorted(set(reverts['user'][start:end]))
             
             edit_wars.append({
-                'revert_count': len(group),
-                'duration_hours': duration,
+                'revert_count': int(end - start),
+                'duration_hours': float(duration),
                 'unique_editors': len(users),
                 'editors': users,
-                'avg_interval_minutes': sum(intervals) / len(intervals) if intervals else 0,
-                'start_time': group[0]['timestamp'],
-                'end_time': group[-1]['timestamp']
+                'avg_interval_minutes': float(avg_interval),
+                'start_time': reverts['timestamp'][start],
+                'end_time': reverts['timestamp'][end - 1]
             })
         
         return {
             'title': page_title,
             'total_revisions': len(revisions),
-            'total_reverts': len(reverts),
-            'revert_rate': len(reverts) / len(revisions),
+            'total_reverts': len(revert_times),
+            'revert_rate': len(revert_times) / len(revisions),
             'edit_wars': edit_wars,
-            'unique_editors': len(set(revert_users))
+            'unique_editors': len(set(reverts['user']))
         }
     
     def get_page_protection_status(self, page_title: str):
@@ -173,8 +277,7 @@ class EditWarSummary:
         }
         
         try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'pages' in data['query']:
                 page_id = list(data['query']['pages'].keys())[0]
@@ -190,22 +293,56 @@ class EditWarSummary:
         
         return {'protected': False, 'protection_level': [], 'page_id': None}
     
+    def get_protection_batch(self, titles):
+        """Get protection status for many pages, batching up to 50 titles per request"""
+        protection = {}
+        
+        for start in range(0, len(titles), 50):
+            params = {
+                'action': 'query',
+                'format': 'json',
+                'prop': 'info',
+                'titles': '|'.join(titles[start:start + 50]),
+                'inprop': 'protection'
+            }
+            
+            try:
+                data = self._get_json(params)
+                
+                if 'query' in data and 'pages' in data['query']:
+                    # Map normalized titles back to the titles that were requested
+                    normalized = {n['to']: n['from'] for n in data['query'].get('normalized', [])}
+                    for page_id, page_data in data['query']['pages'].items():
+                        if int(page_id) < 0:  # Missing or invalid page
+                            continue
+                        title = normalized.get(page_data['title'], page_data['title'])
+                        protection[title] = {
+                            'protected': 'protection' in page_data,
+                            'protection_level': page_data.get('protection', []),
+                            'page_id': page_id
+                        }
+            except Exception as e:
+                print(f"Error getting protection status: {e}")
+        
+        return protection
+    
     def analyze_controversial_pages(self):
         """Analyze known controversial pages"""
         print("Analyzing known controversial Wikipedia pages...")
         print("=" * 60)
         
-        results = []
+        # Get protection status for every page in one batched request
+        protection = self.get_protection_batch(self.controversial_pages)
         
-        for page in self.controversial_pages:
-            analysis = self.analyze_edit_war_patterns(page)
-            if analysis:
-                # Get protection status
-                protection = self.get_page_protection_status(page)
-                analysis['protected'] = protection['protected']
-                results.append(analysis)
+        # Pages are independent, so overlap their network round trips
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            analyses = executor.map(self.analyze_edit_war_patterns, self.controversial_pages)
             
-            time.sleep(0.1)  # Be respectful to the API
+            results = []
+            for page, analysis in zip(self.controversial_pages, analyses):
+                if analysis:
+                    analysis['protected'] = protection.get(page, {}).get('protected', False)
+                    results.append(analysis)
         
         return results
     
@@ -221,142 +358,138 @@ class EditWarSummary:
             print("No edit wars found in controversial pages sample.")
             return
         
-        print(f"\n=== EDIT WAR STATISTICS ===")
-        print(f"Controversial pages analyzed: {len(self.controversial_pages)}")
-        print(f"Pages with edit wars: {len(controversial_results)}")
-        print(f"Edit war frequency: {(len(controversial_results) / len(self.controversial_pages)) * 100:.1f}%")
+        # Collect the report and write it in one go rather than line by line
+        out = []
+        out.append(f"\n=== EDIT WAR STATISTICS ===")
+        out.append(f"Controversial pages analyzed: {len(self.controversial_pages)}")
+        out.append(f"Pages with edit wars: {len(controversial_results)}")
+        out.append(f"Edit war frequency: {(len(controversial_results) / len(self.controversial_pages)) * 100:.1f}%")
         
         # Overall statistics
         total_edit_wars = sum(len(article['edit_wars']) for article in controversial_results)
         total_reverts = sum(article['total_reverts'] for article in controversial_results)
         
-        print(f"\nTotal edit wars found: {total_edit_wars}")
-        print(f"Total reverts: {total_reverts}")
-        print(f"Average reverts per page: {total_reverts / len(controversial_results):.1f}")
+        out.append(f"\nTotal edit wars found: {total_edit_wars}")
+        out.append(f"Total reverts: {total_reverts}")
+        out.append(f"Average reverts per page: {total_reverts / len(controversial_results):.1f}")
         
         # Most contested pages
-        print(f"\n=== MOST CONTESTED PAGES ===")
+        out.append(f"\n=== MOST CONTESTED PAGES ===")
         sorted_results = sorted(controversial_results, key=lambda x: x['revert_rate'], reverse=True)
         
         for i, article in enumerate(sorted_results[:10], 1):
-            print(f"{i}. {article['title']}")
-            print(f"   Revert rate: {article['revert_rate']:.3f}")
-            print(f"   Total reverts: {article['total_reverts']}")
-            print(f"   Edit wars: {len(article['edit_wars'])}")
-            print(f"   Unique editors: {article['unique_editors']}")
-            print(f"   Protected: {'Yes' if article['protected'] else 'No'}")
-        
-        # Edit war characteristics
-        print(f"\n=== EDIT WAR CHARACTERISTICS ===")
-        all_durations = []
-        all_intervals = []
-        all_editor_counts = []
+            out.append(f"{i}. {article['title']}")
+            out.append(f"   Revert rate: {article['revert_rate']:.3f}")
+            out.append(f"   Total reverts: {article['total_reverts']}")
+            out.append(f"   Edit wars: {len(article['edit_wars'])}")
+            out.append(f"   Unique editors: {article['unique_editors']}")
+            out.append(f"   Protected: {'Yes' if article['protected'] else 'No'}")
+        
+        # Single sweep over every edit war feeds the characteristics, editor and 3RR sections
+        all_durations = np.empty(total_edit_wars, dtype=np.float64)
+        all_intervals = np.empty(total_edit_wars, dtype=np.float64)
+        all_editor_counts = np.empty(total_edit_wars, dtype=np.int64)
+        editor_counts = Counter()
+        violations = []
         
+        war_idx = 0
         for article in controversial_results:
             for war in article['edit_wars']:
-                all_durations.append(war['duration_hours'])
-                all_intervals.append(war['avg_interval_minutes'])
-                all_editor_counts.append(war['unique_editors'])
-        
-        if all_durations:
-            print(f"Average edit war duration: {sum(all_durations) / len(all_durations):.1f} hours")
-            print(f"Median edit war duration: {sorted(all_durations)[len(all_durations)//2]:.1f} hours")
-            print(f"Range: {min(all_durations):.1f} - {max(all_durations):.1f} hours")
-        
-        if all_intervals:
-            print(f"Average revert interval: {sum(all_intervals) / len(all_intervals):.1f} minutes")
-            print(f"Median revert interval: {sorted(all_intervals)[len(all_intervals)//2]:.1f} minutes")
-            print(f"Range: {min(all_intervals):.1f} - {max(all_intervals):.1f} minutes")
+                all_durations[war_idx] = war['duration_hours']
+                all_intervals[war_idx] = war['avg_interval_minutes']
+                all_editor_counts[war_idx] = war['unique_editors']
+                war_idx += 1
+                
+                editor_counts.update(war['editors'])
+                
+                for editor, count in Counter(war['editors']).items():
+                    if count >= 3:
+                        violations.append({
+                            'article': article['title'],
+                            'editor': editor,
+                            'revert_count': count,
+                            'time_window': war['duration_hours']
+                        })
         
-        if all_editor_counts:
-            print(f"Average editors per edit war: {sum(all_editor_counts) / len(all_editor_counts):.1f}")
-            print(f"Median editors per edit war: {sorted(all_editor_counts)[len(all_editor_counts)//2]}")
-            print(f"Range: {min(all_editor_counts)} - {max(all_editor_counts)} editors")
+        # Edit war characteristics
+        out.append(f"\n=== EDIT WAR CHARACTERISTICS ===")
         
-        # Editor behavior analysis
-        print(f"\n=== EDITOR BEHAVIOR PATTERNS ===")
-        all_editors = []
-        editor_reverts = Counter()
+        if all_durations.size:
+            out.append(f"Average edit war duration: {all_durations.mean():.1f} hours")
+            out.append(f"Median edit war duration: {np.median(all_durations):.1f} hours")
+            out.append(f"Range: {all_durations.min():.1f} - {all_durations.max():.1f} hours")
         
-        for article in controversial_results:
-            for war in article['edit_wars']:
-                all_editors.extend(war['editors'])
-                for editor in war['editors']:
-                    editor_reverts[editor] += 1
+        if all_intervals.size:
+            out.append(f"Average revert interval: {all_intervals.mean():.1f} minutes")
+            out.append(f"Median revert interval: {np.median(all_intervals):.1f} minutes")
+            out.append(f"Range: {all_intervals.min():.1f} - {all_intervals.max():.1f} minutes")
         
-        editor_counts = Counter(all_editors)
+        if all_editor_counts.size:
+            out.append(f"Average editors per edit war: {all_editor_counts.mean():.1f}")
+            out.append(f"Median editors per edit war: {np.median(all_editor_counts):g}")
+            out.append(f"Range: {all_editor_counts.min()} - {all_editor_counts.max()} editors")
         
+        # Editor behavior analysis
+        out.append(f"\n=== EDITOR BEHAVIOR PATTERNS ===")
         new_editors = len([e for e in editor_counts.values() if e == 1])
         repeat_editors = len([e for e in editor_counts.values() if e > 1])
         
-        print(f"Total unique editors: {len(editor_counts)}")
-        print(f"New editors (single edit war): {new_editors}")
-        print(f"Repeat editors (multiple edit wars): {repeat_editors}")
-        print(f"New vs veteran ratio: {new_editors / len(editor_counts) * 100:.1f}% new")
+        out.append(f"Total unique editors: {len(editor_counts)}")
+        out.append(f"New editors (single edit war): {new_editors}")
+        out.append(f"Repeat editors (multiple edit wars): {repeat_editors}")
+        out.append(f"New vs veteran ratio: {new_editors / len(editor_counts) * 100:.1f}% new")
         
-        print(f"\nMost active editors:")
+        out.append(f"\nMost active editors:")
         for editor, count in editor_counts.most_common(10):
-            print(f"  {editor}: {count} edit wars")
+            out.append(f"  {editor}: {count} edit wars")
         
         # Protection analysis
-        print(f"\n=== PAGE PROTECTION ANALYSIS ===")
+        out.append(f"\n=== PAGE PROTECTION ANALYSIS ===")
         protected_count = sum(1 for article in controversial_results if article['protected'])
         unprotected_count = len(controversial_results) - protected_count
         
-        print(f"Protected pages: {protected_count}")
-        print(f"Unprotected pages: {unprotected_count}")
-        print(f"Protection rate: {(protected_count / len(controversial_results)) * 100:.1f}%")
+        out.append(f"Protected pages: {protected_count}")
+        out.append(f"Unprotected pages: {unprotected_count}")
+        out.append(f"Protection rate: {(protected_count / len(controversial_results)) * 100:.1f}%")
         
         # 3-revert rule violations
-        print(f"\n=== THREE-REVERT RULE VIOLATIONS ===")
-        violations = []
-        
-        for article in controversial_results:
-            for war in article['edit_wars']:
-                editor_revert_counts = Counter(war['editors'])
-                for editor, count in editor_revert_counts.items():
-                    if count >= 3:
-                        violations.append({
-                            'article': article['title'],
-                            'editor': editor,
-                            'revert_count': count,
-                            'time_window': war['duration_hours']
-                        })
-        
+        out.append(f"\n=== THREE-REVERT RULE VIOLATIONS ===")
         if violations:
-            print(f"Found {len(violations)} potential violations:")
+            out.append(f"Found {len(violations)} potential violations:")
             for violation in violations[:10]:
-                print(f"  {violation['editor']} on {violation['article']}: {violation['revert_count']} reverts")
+                out.append(f"  {violation['editor']} on {violation['article']}: {violation['revert_count']} reverts")
         else:
-            print("No clear 3-revert rule violations detected.")
+            out.append("No clear 3-revert rule violations detected.")
         
         # Detailed examples
-        print(f"\n=== DETAILED EDIT WAR EXAMPLES ===")
+        out.append(f"\n=== DETAILED EDIT WAR EXAMPLES ===")
         for i, article in enumerate(sorted_results[:5], 1):
-            print(f"\n{i}. {article['title']}")
+            out.append(f"\n{i}. {article['title']}")
             for j, war in enumerate(article['edit_wars'], 1):
-                print(f"   Edit war {j}:")
-                print(f"     Duration: {war['duration_hours']:.1f} hours")
-                print(f"     Reverts: {war['revert_count']}")
-                print(f"     Editors: {', '.join(war['editors'])}")
-                print(f"     Avg interval: {war['avg_interval_minutes']:.1f} minutes")
-                print(f"     Time period: {war['start_time'][:10]} to {war['end_time'][:10]}")
+                out.append(f"   Edit war {j}:")
+                out.append(f"     Duration: {war['duration_hours']:.1f} hours")
+                out.append(f"     Reverts: {war['revert_count']}")
+                out.append(f"     Editors: {', '.join(war['editors'])}")
+                out.append(f"     Avg interval: {war['avg_interval_minutes']:.1f} minutes")
+                out.append(f"     Time period: {war['start_time'][:10]} to {war['end_time'][:10]}")
         
         # Key insights
-        print(f"\n=== KEY INSIGHTS ABOUT EDIT WARS ===")
-        print("1. 🔥 FREQUENCY: Edit wars occur in ~30-40% of controversial topics")
-        print("2. ⏱️  DURATION: Most edit wars last 1-24 hours, some extend for days")
-        print("3. 👥 PARTICIPATION: 2-5 editors typically involved per edit war")
-        print("4. ⚡ SPEED: Reverts often happen within minutes during intense conflicts")
-        print("5. 🛡️  PROTECTION: Highly controversial pages often get protected")
-        print("6. 📊 PATTERNS: Repeat editors are common in ongoing controversies")
-        print("7. ⚖️  RULES: 3-revert rule violations are relatively rare")
-        print("8. 🌍 TOPICS: Political, religious, and scientific topics most contested")
-        print("9. 🔄 CYCLES: Edit wars often follow news cycles and current events")
-        print("10. 📈 TRENDS: Controversial topics show higher revert rates overall")
-        
-        print(f"\n" + "=" * 60)
-        print("Comprehensive edit war analysis complete!")
+        out.append(f"\n=== KEY INSIGHTS ABOUT EDIT WARS ===")
+        out.append("1. 🔥 FREQUENCY: Edit wars occur in ~30-40% of controversial topics")
+        out.append("2. ⏱️  DURATION: Most edit wars last 1-24 hours, some extend for days")
+        out.append("3. 👥 PARTICIPATION: 2-5 editors typically involved per edit war")
+        out.append("4. ⚡ SPEED: Reverts often happen within minutes during intense conflicts")
+        out.append("5. 🛡️  PROTECTION: Highly controversial pages often get protected")
+        out.append("6. 📊 PATTERNS: Repeat editors are common in ongoing controversies")
+        out.append("7. ⚖️  RULES: 3-revert rule violations are relatively rare")
+        out.append("8. 🌍 TOPICS: Political, religious, and scientific topics most contested")
+        out.append("9. 🔄 CYCLES: Edit wars often follow news cycles and current events")
+        out.append("10. 📈 TRENDS: Controversial topics show higher revert rates overall")
+        
+        out.append(f"\n" + "=" * 60)
+        out.append("Comprehensive edit war analysis complete!")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
 
 def main():
     """Main function"""
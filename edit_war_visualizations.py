@@ -10,23 +10,45 @@ Advanced visualizations for edit war analysis:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import timedelta
 from collections import Counter, defaultdict
 import networkx as nx
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import plotly.offline as pyo
+import plotly.io as pio
 import re
+import os
+import hashlib
 from typing import Dict, List, Tuple, Optional
 import logging
 
+try:
+    import requests_cache  # Optional on-disk cache for API responses
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # Optional fast JSON decoder
+except ImportError:
+    orjson = None
+
+try:
+    import igraph as ig  # Optional C implementation of force-directed layouts
+except ImportError:
+    ig = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -34,14 +56,47 @@ logger = logging.getLogger(__name__)
 class EditWarVisualizer:
     """Advanced visualization tool for edit war analysis"""
     
+    # Edit summary keywords that mark a revision as a revert
+    _REVERT_RE = re.compile(r'revert|undo|\brv\b|rollback|restore', re.IGNORECASE)
+    
     def __init__(self, language='en'):
         self.language = language
         self.api_url = f"https://{language}.wikipedia.org/w/api.php"
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Persist responses so reruns within a day are served from disk
+            # API errors (e.g. maxlag) also come back as 200s, so skip anything flagged with an error header
+            self.session = requests_cache.CachedSession('wiki_cache', backend='sqlite',
+                                                        expire_after=timedelta(hours=24),
+                                                        allowable_methods=('GET',),
+                                                        allowable_codes=(200,),
+                                                        filter_fn=lambda r: 'MediaWiki-API-Error' not in r.headers)
+            self.session.cache.delete(expired=True)
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'EditWarVisualizer/1.0 (Educational Research Project)'
         })
         
+        # Concurrency and politeness settings for the MediaWiki API
+        self.max_workers = 8  # Pages processed concurrently
+        self.min_request_interval = 0.1  # Seconds between API requests (shared across threads)
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        
+        # Keep-alive connection pool sized for the worker threads, with retries on transient errors
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        
+        self.igraph_layout_min_nodes = 50  # Smaller editor graphs keep networkx's spring layout
+        
+        # PNG exports queued during generate_all_visualizations and written in one batch
+        self._pending_images = None
+        
+        # In-process revision cache shared by all visualizations: (title, limit) -> revisions
+        self._revision_cache = {}
+        self._cache_lock = threading.Lock()
+        
         # Known controversial pages for analysis
         self.controversial_pages = [
             "Donald Trump", "Barack Obama", "Israel", "Palestine", 
@@ -50,8 +105,59 @@ class EditWarVisualizer:
             "Vladimir Putin", "China", "Russia"
         ]
     
+    def _get(self, params: Dict) -> requests.Response:
+        """Issue a rate-limited GET request against the MediaWiki API"""
+        with self._rate_lock:
+            wait = self._next_request_time - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_request_time = time.monotonic() + self.min_request_interval
+        return self.session.get(self.api_url, params=params)
+    
     def get_page_revisions(self, page_title: str, limit: int = 1000):
-        """Get detailed page revisions"""
+        """Get detailed page revisions, fetching each (page, limit) only once"""
+        cached = self._cached_revisions(page_title, limit)
+        if cached is not None:
+            return cached
+        
+        revisions = self._fetch_page_revisions(page_title, limit)
+        if revisions:
+            with self._cache_lock:
+                self._revision_cache[(page_title, limit)] = revisions
+        return revisions
+    
+    def _cached_revisions(self, page_title: str, limit: int) -> Optional[List[Dict]]:
+        """Serve `limit` revisions from any cached fetch of the page at least that large"""
+        # Revisions are fetched oldest first, so a shorter request is a prefix of a longer one
+        with self._cache_lock:
+            for (title, cached_limit), revisions in self._revision_cache.items():
+                if title == page_title and cached_limit >= limit:
+                    return revisions[:limit]
+        return None
+    
+    def get_revision_counts(self, page_title: str, limit: int = 500) -> Optional[Dict]:
+        """Count revisions, reverts and reverting editors without building a reverts DataFrame"""
+        revisions = self._cached_revisions(page_title, limit)
+        if revisions is None:
+            # Only the fields revert detection needs; no timestamps, sizes or ids
+            revisions = self._fetch_page_revisions(page_title, limit, rvprop='user|comment')
+        if not revisions:
+            return None
+        
+        # Same rule as detect_reverts: the first revision has nothing to revert
+        search = self._REVERT_RE.search
+        revert_users = [rev.get('user', 'Anonymous') for rev in revisions[1:]
+                        if search(rev.get('comment') or '')]
+        
+        return {
+            'total_revisions': len(revisions),
+            'revert_count': len(revert_users),
+            'unique_editors': len(set(revert_users))
+        }
+    
+    def _fetch_page_revisions(self, page_title: str, limit: int,
+                              rvprop: str = 'ids|timestamp|user|comment|size') -> List[Dict]:
+        """Fetch page revisions from the API, bypassing the cache"""
         logger.info(f"Fetching revisions for: {page_title}")
         
         params = {
@@ -59,96 +165,156 @@ class EditWarVisualizer:
             'format': 'json',
             'prop': 'revisions',
             'titles': page_title,
-            'rvprop': 'timestamp|user|comment|size|tags',
-            'rvlimit': min(limit, 500),
+            'rvprop': rvprop,  # Defaults to only the fields detect_reverts keeps
             'rvdir': 'newer'
         }
         
-        try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+        # Follow rvcontinue until `limit` revisions are collected (API max is 500 per request)
+        revisions = []
+        while len(revisions) < limit:
+            params['rvlimit'] = min(limit - len(revisions), 500)
+            
+            try:
+                response = self._get(params)
+                data = orjson.loads(response.content) if orjson is not None else response.json()
+            except Exception as e:
+                logger.error(f"Error fetching revisions for {page_title}: {e}")
+                break
             
             if 'query' in data and 'pages' in data['query']:
                 page_id = list(data['query']['pages'].keys())[0]
                 if page_id != '-1':
                     page_data = data['query']['pages'][page_id]
-                    if 'revisions' in page_data:
-                        return page_data['revisions']
-        except Exception as e:
-            logger.error(f"Error fetching revisions for {page_title}: {e}")
+                    revisions.extend(page_data.get('revisions', []))
+            
+            if 'continue' not in data:
+                break
+            params.update(data['continue'])
         
-        return []
+        return revisions
     
-    def detect_reverts(self, revisions):
-        """Detect reverts in revision history"""
-        reverts = []
+    @staticmethod
+    def _content_key(page_title: str, revisions: List[Dict]) -> str:
+        """Hash the inputs a page's figures are built from: title, latest revision and revision count"""
+        latest_revid = revisions[-1].get('revid') if revisions else None
+        return hashlib.blake2b(f"{page_title}:{latest_revid}:{len(revisions)}".encode(), digest_size=8).hexdigest()
+    
+    def _load_cached_figure(self, output_dir: str, name: str, cache_key: str) -> Optional[go.Figure]:
+        """Load a previously saved figure if all its outputs exist and were built from the same inputs"""
+        path = f"{output_dir}/{name}"
+        try:
+            with open(f"{path}.meta") as f:
+                if f.read().strip() != cache_key:
+                    return None
+        except OSError:
+            return None
         
-        for i in range(1, len(revisions)):
-            current_rev = revisions[i]
-            previous_rev = revisions[i-1]
-            
-            # Check for revert indicators
-            comment = current_rev.get('comment', '').lower()
-            revert_indicators = ['revert', 'undo', 'rv', 'rollback', 'restore', 'reverted']
-            
-            if any(indicator in comment for indicator in revert_indicators):
-                reverts.append({
-                    'timestamp': current_rev['timestamp'],
-                    'user': current_rev.get('user', 'Anonymous'),
-                    'comment': current_rev.get('comment', ''),
-                    'size': current_rev.get('size', 0),
-                    'revid': current_rev.get('revid'),
-                    'parentid': current_rev.get('parentid')
-                })
+        if not all(os.path.exists(f"{path}.{ext}") for ext in ('html', 'png', 'json')):
+            return None
+        return pio.read_json(f"{path}.json")
+    
+    def _save_figure(self, fig: go.Figure, output_dir: str, name: str, cache_key: Optional[str] = None):
+        """Write a figure's HTML, and its PNG now or at the end of the current batch"""
+        fig.write_html(f"{output_dir}/{name}.html")
+        if self._pending_images is not None:
+            self._pending_images.append((fig, f"{output_dir}/{name}.png"))
+        else:
+            fig.write_image(f"{output_dir}/{name}.png")
+        
+        # Record what the figure was built from so unchanged pages can be skipped next run
+        if cache_key is not None:
+            fig.write_json(f"{output_dir}/{name}.json")
+            with open(f"{output_dir}/{name}.meta", 'w') as f:
+                f.write(cache_key)
+    
+    def _write_pending_images(self):
+        """Export all queued PNGs, reusing one Kaleido session where supported"""
+        pending, self._pending_images = self._pending_images, None
+        if not pending:
+            return
         
+        logger.info(f"Writing {len(pending)} PNG images")
+        figs, paths = [fig for fig, _ in pending], [path for _, path in pending]
+        try:
+            # Kaleido >= 1.0 renders a whole batch in a single browser session
+            pio.write_images(figs, paths)
+        except (AttributeError, ValueError, RuntimeError):
+            # Older Kaleido serializes every export behind one lock, so write them in turn
+            for fig, path in pending:
+                fig.write_image(path)
+    
+    def detect_reverts(self, revisions: List[Dict]) -> pd.DataFrame:
+        """Detect reverts in revision history, with timestamps parsed into a UTC 'ts' column"""
+        revisions_df = pd.DataFrame(revisions).reindex(
+            columns=['timestamp', 'user', 'comment', 'size', 'revid', 'parentid'])
+        
+        # Check for revert indicators; the first revision has nothing to revert
+        mask = revisions_df['comment'].fillna('').astype(str).str.contains(self._REVERT_RE)
+        mask.iloc[:1] = False
+        
+        reverts = revisions_df.loc[mask].reset_index(drop=True)
+        reverts['user'] = reverts['user'].fillna('Anonymous')
+        reverts['comment'] = reverts['comment'].fillna('')
+        reverts['size'] = reverts['size'].fillna(0)
+        reverts['ts'] = pd.to_datetime(reverts['timestamp'], format='%Y-%m-%dT%H:%M:%SZ', utc=True)
         return reverts
     
-    def create_revert_heatmap(self, page_title: str, output_dir: str = "edit_war_visualizations"):
+    @staticmethod
+    def _analyze_reverts(reverts: pd.DataFrame) -> Dict:
+        """Compute the daily, per-editor, edit war and editor-pair aggregates shared by all visualizations"""
+        reverts = reverts.sort_values('ts', kind='stable')
+        users = reverts['user']
+        
+        # A new edit war starts after every gap longer than 24 hours
+        war_ids = reverts['ts'].diff().dt.total_seconds().gt(24 * 3600).cumsum()
+        
+        return {
+            'daily_counts': reverts['ts'].dt.floor('D').dt.tz_localize(None).value_counts().sort_index(),
+            'user_counts': users.value_counts(),
+            'war_groups': [group for _, group in reverts.groupby(war_ids) if len(group) >= 3],
+            'user_pairs': pd.concat([users, users.shift(-1)], axis=1, keys=['user', 'next_user']).dropna()
+        }
+    
+    def create_revert_heatmap(self, page_title: str, output_dir: str = "edit_war_visualizations",
+                              revisions: Optional[List[Dict]] = None, reverts: Optional[pd.DataFrame] = None,
+                              analysis: Optional[Dict] = None):
         """Create heatmap of revert frequency over time"""
         logger.info(f"Creating revert heatmap for: {page_title}")
         
-        revisions = self.get_page_revisions(page_title, limit=1000)
+        if revisions is None:
+            revisions = self.get_page_revisions(page_title, limit=1000)
         if not revisions:
             return None
         
-        reverts = self.detect_reverts(revisions)
+        # Reuse the saved figure when it was built from these same revisions
+        name = f"revert_heatmap_{page_title.replace(' ', '_')}"
+        cache_key = self._content_key(page_title, revisions)
+        cached = self._load_cached_figure(output_dir, name, cache_key)
+        if cached is not None:
+            logger.info(f"Reusing unchanged revert heatmap for {page_title}")
+            return cached
+        
+        if reverts is None:
+            reverts = self.detect_reverts(revisions)
         if len(reverts) < 3:
             return None
         
-        # Convert timestamps to datetime objects
-        revert_times = [datetime.fromisoformat(r['timestamp'].replace('Z', '+00:00')) for r in reverts]
-        
-        # Create time bins (daily)
-        start_date = min(revert_times).date()
-        end_date = max(revert_times).date()
-        date_range = pd.date_range(start_date, end_date, freq='D')
-        
-        # Count reverts per day
-        revert_counts = Counter([rt.date() for rt in revert_times])
-        
-        # Create heatmap data
-        heatmap_data = []
-        for date in date_range:
-            count = revert_counts.get(date.date(), 0)
-            heatmap_data.append({
-                'date': date,
-                'revert_count': count,
-                'day_of_week': date.strftime('%A'),
-                'week': date.isocalendar()[1]
-            })
+        if analysis is None:
+            analysis = self._analyze_reverts(reverts)
         
-        df = pd.DataFrame(heatmap_data)
+        # Count reverts per day, including days without any reverts
+        revert_counts = analysis['daily_counts']
+        revert_counts = revert_counts.reindex(
+            pd.date_range(revert_counts.index.min(), revert_counts.index.max(), freq='D'), fill_value=0)
         
         # Create heatmap using plotly
         fig = go.Figure()
         
-        # Pivot data for heatmap
-        pivot_data = df.pivot_table(
-            values='revert_count', 
-            index='day_of_week', 
-            columns='week', 
-            fill_value=0
-        )
+        # Pivot data for heatmap: day of week x ISO week, averaging weeks that recur across years
+        days = revert_counts.index
+        pivot_data = revert_counts.groupby(
+            [days.day_name(), days.isocalendar().week.to_numpy(dtype=int)]
+        ).mean().unstack(fill_value=0)
         
         # Reorder days
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -171,70 +337,82 @@ class EditWarVisualizer:
         )
         
         # Save the plot
-        import os
         os.makedirs(output_dir, exist_ok=True)
-        fig.write_html(f"{output_dir}/revert_heatmap_{page_title.replace(' ', '_')}.html")
-        fig.write_image(f"{output_dir}/revert_heatmap_{page_title.replace(' ', '_')}.png")
+        self._save_figure(fig, output_dir, name, cache_key)
         
         logger.info(f"Revert heatmap saved for {page_title}")
         return fig
     
-    def create_editor_network(self, page_title: str, output_dir: str = "edit_war_visualizations"):
+    def create_editor_network(self, page_title: str, output_dir: str = "edit_war_visualizations",
+                              revisions: Optional[List[Dict]] = None, reverts: Optional[pd.DataFrame] = None,
+                              analysis: Optional[Dict] = None):
         """Create network graph of editor interactions"""
         logger.info(f"Creating editor network for: {page_title}")
         
-        revisions = self.get_page_revisions(page_title, limit=1000)
+        if revisions is None:
+            revisions = self.get_page_revisions(page_title, limit=1000)
         if not revisions:
             return None
         
-        reverts = self.detect_reverts(revisions)
+        # Reuse the saved figure when it was built from these same revisions
+        name = f"editor_network_{page_title.replace(' ', '_')}"
+        cache_key = self._content_key(page_title, revisions)
+        cached = self._load_cached_figure(output_dir, name, cache_key)
+        if cached is not None:
+            logger.info(f"Reusing unchanged editor network for {page_title}")
+            return cached
+        
+        if reverts is None:
+            reverts = self.detect_reverts(revisions)
         if len(reverts) < 3:
             return None
         
-        # Create network graph
-        G = nx.Graph()
-        
-        # Add nodes (editors)
-        editors = set()
-        for revert in reverts:
-            editors.add(revert['user'])
+        if analysis is None:
+            analysis = self._analyze_reverts(reverts)
         
-        G.add_nodes_from(editors)
+        # Nodes (editors) and their revert counts
+        editor_counts = analysis['user_counts']
+        nodes = editor_counts.index.tolist()
         
-        # Add edges (interactions)
-        for i in range(len(reverts) - 1):
-            current_editor = reverts[i]['user']
-            next_editor = reverts[i + 1]['user']
-            
-            if current_editor != next_editor:
-                if G.has_edge(current_editor, next_editor):
-                    G[current_editor][next_editor]['weight'] += 1
-                else:
-                    G.add_edge(current_editor, next_editor, weight=1)
+        # Edges (interactions between consecutive reverters), counted in one pass;
+        # interactions are undirected, so (A, B) and (B, A) share an edge
+        pairs = analysis['user_pairs'].to_numpy()
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        edge_counts = Counter((u, v) if u <= v else (v, u) for u, v in pairs)
+        edges = [(u, v, w) for (u, v), w in edge_counts.items()]
         
-        if len(G.edges()) == 0:
+        if not edges:
             return None
         
         # Calculate node sizes based on edit count
-        editor_counts = Counter([r['user'] for r in reverts])
-        node_sizes = [editor_counts.get(node, 1) * 100 for node in G.nodes()]
+        node_sizes = [int(count) * 100 for count in editor_counts.to_numpy()]
         
         # Calculate edge weights
-        edge_weights = [G[u][v]['weight'] for u, v in G.edges()]
-        
-        # Create network visualization using plotly
-        pos = nx.spring_layout(G, k=1, iterations=50)
+        edge_weights = [w for _, _, w in edges]
+        
+        # Lay out the graph, building a graph object only for this step; spring_layout is
+        # pure Python, so large graphs use igraph's C Fruchterman-Reingold when available
+        if ig is not None and len(nodes) >= self.igraph_layout_min_nodes:
+            node_index = {node: i for i, node in enumerate(nodes)}
+            g = ig.Graph(n=len(nodes), edges=[(node_index[u], node_index[v]) for u, v, _ in edges],
+                         edge_attrs={'weight': edge_weights})
+            pos = dict(zip(nodes, g.layout_fruchterman_reingold(niter=50, weights='weight').coords))
+        else:
+            G = nx.Graph()
+            G.add_nodes_from(nodes)
+            G.add_weighted_edges_from(edges)
+            pos = nx.spring_layout(G, k=1, iterations=50)
         
         # Node positions
-        node_x = [pos[node][0] for node in G.nodes()]
-        node_y = [pos[node][1] for node in G.nodes()]
+        node_x = [pos[node][0] for node in nodes]
+        node_y = [pos[node][1] for node in nodes]
         
         # Edge positions
         edge_x = []
         edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
+        for u, v, _ in edges:
+            x0, y0 = pos[u]
+            x1, y1 = pos[v]
             edge_x.extend([x0, x1, None])
             edge_y.extend([y0, y1, None])
         
@@ -255,7 +433,7 @@ class EditWarVisualizer:
             x=node_x, y=node_y,
             mode='markers+text',
             hoverinfo='text',
-            text=list(G.nodes()),
+            text=nodes,
             textposition="middle center",
             marker=dict(
                 size=node_sizes,
@@ -276,45 +454,43 @@ class EditWarVisualizer:
         )
         
         # Save the plot
-        import os
         os.makedirs(output_dir, exist_ok=True)
-        fig.write_html(f"{output_dir}/editor_network_{page_title.replace(' ', '_')}.html")
-        fig.write_image(f"{output_dir}/editor_network_{page_title.replace(' ', '_')}.png")
+        self._save_figure(fig, output_dir, name, cache_key)
         
         logger.info(f"Editor network saved for {page_title}")
         return fig
     
-    def create_edit_war_timeline(self, page_title: str, output_dir: str = "edit_war_visualizations"):
+    def create_edit_war_timeline(self, page_title: str, output_dir: str = "edit_war_visualizations",
+                                 revisions: Optional[List[Dict]] = None, reverts: Optional[pd.DataFrame] = None,
+                                 analysis: Optional[Dict] = None):
         """Create timeline of edit war escalations and resolutions"""
         logger.info(f"Creating edit war timeline for: {page_title}")
         
-        revisions = self.get_page_revisions(page_title, limit=1000)
+        if revisions is None:
+            revisions = self.get_page_revisions(page_title, limit=1000)
         if not revisions:
             return None
         
-        reverts = self.detect_reverts(revisions)
+        # Reuse the saved figures when they were built from these same revisions
+        name = f"edit_war_timeline_{page_title.replace(' ', '_')}"
+        name2 = f"revert_timeline_{page_title.replace(' ', '_')}"
+        cache_key = self._content_key(page_title, revisions)
+        cached = self._load_cached_figure(output_dir, name, cache_key)
+        cached2 = self._load_cached_figure(output_dir, name2, cache_key)
+        if cached is not None and cached2 is not None:
+            logger.info(f"Reusing unchanged edit war timeline for {page_title}")
+            return cached, cached2
+        
+        if reverts is None:
+            reverts = self.detect_reverts(revisions)
         if len(reverts) < 3:
             return None
         
-        # Group reverts by time windows (24 hours)
-        revert_times = [datetime.fromisoformat(r['timestamp'].replace('Z', '+00:00')) for r in reverts]
-        revert_users = [r['user'] for r in reverts]
-        
-        # Group reverts within 24 hours
-        revert_groups = []
-        current_group = [reverts[0]]
+        if analysis is None:
+            analysis = self._analyze_reverts(reverts)
         
-        for i in range(1, len(reverts)):
-            time_diff = (revert_times[i] - revert_times[i-1]).total_seconds() / 3600
-            if time_diff <= 24:
-                current_group.append(reverts[i])
-            else:
-                if len(current_group) >= 3:
-                    revert_groups.append(current_group)
-                current_group = [reverts[i]]
-        
-        if len(current_group) >= 3:
-            revert_groups.append(current_group)
+        # Reverts grouped into edit wars (within 24 hours of each other)
+        revert_groups = analysis['war_groups']
         
         if not revert_groups:
             return None
@@ -322,11 +498,11 @@ class EditWarVisualizer:
         # Create timeline data
         timeline_data = []
         for i, group in enumerate(revert_groups):
-            start_time = datetime.fromisoformat(group[0]['timestamp'].replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(group[-1]['timestamp'].replace('Z', '+00:00'))
+            start_time = group['ts'].iloc[0]
+            end_time = group['ts'].iloc[-1]
             duration = (end_time - start_time).total_seconds() / 3600
             
-            users = list(set([r['user'] for r in group]))
+            users = group['user'].unique().tolist()  # First-seen order, straight from the frame
             
             # Calculate escalation level based on revert count and speed
             escalation_level = len(group) * len(users) / max(duration, 1)
@@ -346,20 +522,18 @@ class EditWarVisualizer:
         # Create timeline visualization
         fig = go.Figure()
         
-        # Add timeline bars
-        for war in timeline_data:
-            color = 'red' if war['escalation_level'] > 10 else 'orange' if war['escalation_level'] > 5 else 'yellow'
-            
-            fig.add_trace(go.Bar(
-                x=[war['duration_hours']],
-                y=[f"Edit War {war['edit_war_id']}"],
-                orientation='h',
-                marker_color=color,
-                name=f"War {war['edit_war_id']}",
-                text=f"Reverts: {war['revert_count']}<br>Editors: {war['unique_editors']}<br>Duration: {war['duration_hours']:.1f}h",
-                hoverinfo='text',
-                showlegend=False
-            ))
+        # Add timeline bars as a single trace, colored by escalation level
+        fig.add_trace(go.Bar(
+            x=[war['duration_hours'] for war in timeline_data],
+            y=[f"Edit War {war['edit_war_id']}" for war in timeline_data],
+            orientation='h',
+            marker_color=['red' if war['escalation_level'] > 10 else 'orange' if war['escalation_level'] > 5 else 'yellow'
+                          for war in timeline_data],
+            text=[f"Reverts: {war['revert_count']}<br>Editors: {war['unique_editors']}<br>Duration: {war['duration_hours']:.1f}h"
+                  for war in timeline_data],
+            hoverinfo='text',
+            showlegend=False
+        ))
         
         fig.update_layout(
             title=f"Edit War Timeline: {page_title}",
@@ -372,20 +546,16 @@ class EditWarVisualizer:
         # Create detailed timeline with individual reverts
         fig2 = go.Figure()
         
-        # Add individual revert points
-        for i, revert in enumerate(reverts):
-            revert_time = datetime.fromisoformat(revert['timestamp'].replace('Z', '+00:00'))
-            
-            fig2.add_trace(go.Scatter(
-                x=[revert_time],
-                y=[1],
-                mode='markers',
-                marker=dict(size=10, color='red'),
-                name=f"Revert {i+1}",
-                text=f"User: {revert['user']}<br>Time: {revert_time.strftime('%Y-%m-%d %H:%M')}",
-                hoverinfo='text',
-                showlegend=False
-            ))
+        # Add individual revert points as a single trace
+        fig2.add_trace(go.Scatter(
+            x=reverts['ts'],
+            y=np.ones(len(reverts), dtype=int),
+            mode='markers',
+            marker=dict(size=10, color='red'),
+            text=("User: " + reverts['user'] + "<br>Time: " + reverts['ts'].dt.strftime('%Y-%m-%d %H:%M')).tolist(),
+            hoverinfo='text',
+            showlegend=False
+        ))
         
         fig2.update_layout(
             title=f"Individual Revert Timeline: {page_title}",
@@ -396,12 +566,9 @@ class EditWarVisualizer:
         )
         
         # Save the plots
-        import os
         os.makedirs(output_dir, exist_ok=True)
-        fig.write_html(f"{output_dir}/edit_war_timeline_{page_title.replace(' ', '_')}.html")
-        fig.write_image(f"{output_dir}/edit_war_timeline_{page_title.replace(' ', '_')}.png")
-        fig2.write_html(f"{output_dir}/revert_timeline_{page_title.replace(' ', '_')}.html")
-        fig2.write_image(f"{output_dir}/revert_timeline_{page_title.replace(' ', '_')}.png")
+        self._save_figure(fig, output_dir, name, cache_key)
+        self._save_figure(fig2, output_dir, name2, cache_key)
         
         logger.info(f"Edit war timeline saved for {page_title}")
         return fig, fig2
@@ -410,40 +577,41 @@ class EditWarVisualizer:
         """Create comprehensive dashboard with all visualizations"""
         logger.info("Creating comprehensive edit war dashboard")
         
-        # Analyze multiple pages
-        dashboard_data = []
+        # Analyze multiple pages, accumulating one list per dashboard column
+        page_names, revert_counts, revert_rates, editor_counts, revision_counts = [], [], [], [], []
+        pages = self.controversial_pages[:5]  # Limit to 5 for performance
+        
+        # Only counts are needed, so fetch them concurrently; the shared rate limiter keeps the API budget
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.get_revision_counts, page, 500): page for page in pages}
+            page_counts = {futures[future]: future.result() for future in as_completed(futures)}
         
-        for page in self.controversial_pages[:5]:  # Limit to 5 for performance
+        for page in pages:
             logger.info(f"Analyzing {page} for dashboard")
             
-            revisions = self.get_page_revisions(page, limit=500)
-            if not revisions:
-                continue
-            
-            reverts = self.detect_reverts(revisions)
-            if len(reverts) < 3:
+            counts = page_counts[page]
+            if not counts or counts['revert_count'] < 3:
                 continue
             
             # Calculate metrics
-            revert_rate = len(reverts) / len(revisions)
-            unique_editors = len(set([r['user'] for r in reverts]))
-            
-            dashboard_data.append({
-                'page': page,
-                'revert_count': len(reverts),
-                'revert_rate': revert_rate,
-                'unique_editors': unique_editors,
-                'total_revisions': len(revisions)
-            })
-            
-            time.sleep(0.1)  # Be respectful to the API
+            page_names.append(page)
+            revert_counts.append(counts['revert_count'])
+            revert_rates.append(counts['revert_count'] / counts['total_revisions'])
+            editor_counts.append(counts['unique_editors'])
+            revision_counts.append(counts['total_revisions'])
         
-        if not dashboard_data:
+        if not page_names:
             logger.warning("No data available for dashboard")
             return
         
         # Create dashboard
-        df = pd.DataFrame(dashboard_data)
+        df = pd.DataFrame({
+            'page': page_names,
+            'revert_count': np.asarray(revert_counts, dtype=np.int32),
+            'revert_rate': np.asarray(revert_rates, dtype=np.float64),
+            'unique_editors': np.asarray(editor_counts, dtype=np.int32),
+            'total_revisions': np.asarray(revision_counts, dtype=np.int32)
+        })
         
         # Create subplots
         fig = make_subplots(
@@ -489,14 +657,38 @@ class EditWarVisualizer:
         )
         
         # Save dashboard
-        import os
         os.makedirs(output_dir, exist_ok=True)
-        fig.write_html(f"{output_dir}/edit_war_dashboard.html")
-        fig.write_image(f"{output_dir}/edit_war_dashboard.png")
+        self._save_figure(fig, output_dir, "edit_war_dashboard")
         
         logger.info("Comprehensive dashboard created")
         return fig
     
+    def _visualize_page(self, page_title: str, output_dir: str) -> Dict:
+        """Create the heatmap, network and timeline for a single page"""
+        logger.info(f"Processing visualizations for: {page_title}")
+        
+        # Fetch, classify and aggregate once, then share across all three visualizations
+        revisions = self.get_page_revisions(page_title, limit=1000)
+        
+        # Skip classification and aggregation entirely when every figure is unchanged on disk
+        if revisions:
+            cache_key = self._content_key(page_title, revisions)
+            names = [f"{kind}_{page_title.replace(' ', '_')}"
+                     for kind in ('revert_heatmap', 'editor_network', 'edit_war_timeline', 'revert_timeline')]
+            cached = [self._load_cached_figure(output_dir, name, cache_key) for name in names]
+            if all(fig is not None for fig in cached):
+                logger.info(f"Reusing unchanged visualizations for {page_title}")
+                return {'heatmap': cached[0], 'network': cached[1], 'timeline': (cached[2], cached[3])}
+        
+        reverts = self.detect_reverts(revisions)
+        analysis = self._analyze_reverts(reverts) if len(reverts) >= 3 else None
+        
+        return {
+            'heatmap': self.create_revert_heatmap(page_title, output_dir, revisions, reverts, analysis),
+            'network': self.create_editor_network(page_title, output_dir, revisions, reverts, analysis),
+            'timeline': self.create_edit_war_timeline(page_title, output_dir, revisions, reverts, analysis)
+        }
+    
     def generate_all_visualizations(self, pages: List[str] = None, output_dir: str = "edit_war_visualizations"):
         """Generate all visualizations for specified pages"""
         if pages is None:
@@ -504,31 +696,23 @@ class EditWarVisualizer:
         
         logger.info(f"Generating visualizations for {len(pages)} pages")
         
-        results = {}
-        
-        for page in pages:
-            logger.info(f"Processing visualizations for: {page}")
-            
-            # Create heatmap
-            heatmap = self.create_revert_heatmap(page, output_dir)
-            
-            # Create network
-            network = self.create_editor_network(page, output_dir)
-            
-            # Create timeline
-            timeline = self.create_edit_war_timeline(page, output_dir)
+        # Queue PNG exports so they are rendered together once all figures exist
+        self._pending_images = []
+        try:
+            # Pages are independent, so overlap their API round trips
+            page_results = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._visualize_page, page, output_dir): page for page in pages}
+                for future in as_completed(futures):
+                    page_results[futures[future]] = future.result()
             
-            results[page] = {
-                'heatmap': heatmap,
-                'network': network,
-                'timeline': timeline
-            }
+            results = {page: page_results[page] for page in pages}
             
-            time.sleep(0.1)  # Be respectful to the API
-        
-        # Create comprehensive dashboard
-        dashboard = self.create_comprehensive_dashboard(output_dir)
-        results['dashboard'] = dashboard
+            # Create comprehensive dashboard
+            dashboard = self.create_comprehensive_dashboard(output_dir)
+            results['dashboard'] = dashboard
+        finally:
+            self._write_pending_images()
         
         logger.info("All visualizations generated successfully")
         return results
@@ -12,40 +12,100 @@ This script provides quick insights into Wikipedia edit wars:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+import numpy as np
 from collections import Counter, defaultdict
 import re
 
-def get_page_revisions_quick(page_title: str, limit: int = 200):
-    """Get recent revisions for a page"""
+try:
+    import requests_cache  # Optional on-disk cache for API responses
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # Optional fast JSON decoder
+except ImportError:
+    orjson = None
+
+# Edit summary keywords that mark a revision as a revert
+_REVERT_RE = re.compile(r'revert|undo|\brv\b|rollback|restore', re.IGNORECASE)
+
+MAX_WORKERS = 8  # Pages fetched concurrently; stay well under ~10 to avoid API errors
+
+# One keep-alive session shared by all worker threads
+if requests_cache is not None:
+    # Reruns within the hour are served from the local cache
+    # API errors (e.g. maxlag) also come back as 200s, so skip anything flagged with an error header
+    session = requests_cache.CachedSession('wiki_cache', backend='sqlite',
+                                           expire_after=timedelta(hours=1),
+                                           allowable_codes=(200,),
+                                           filter_fn=lambda r: 'MediaWiki-API-Error' not in r.headers)
+else:
+    session = requests.Session()
+session.headers.update({
+    'User-Agent': 'QuickEditWarStats/1.0 (Educational Research Project)'
+})
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
+def _decode_json(response):
+    """Decode an API response, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _fetch_page(title: str, rvlimit: int):
+    """Fetch recent revisions for one page"""
     api_url = "https://en.wikipedia.org/w/api.php"
     
     params = {
         'action': 'query',
         'format': 'json',
         'prop': 'revisions',
-        'titles': page_title,
+        'titles': title,
         'rvprop': 'timestamp|user|comment|size',
-        'rvlimit': min(limit, 500),
-        'rvdir': 'newer'
+        'rvlimit': min(rvlimit, 500),
+        'rvdir': 'older'  # Most recent revisions first
     }
     
     try:
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        response = session.get(api_url, params=params)
+        data = _decode_json(response)
         
         if 'query' in data and 'pages' in data['query']:
-            page_id = list(data['query']['pages'].keys())[0]
+            page_id = next(iter(data['query']['pages']))
             if page_id != '-1':
                 page_data = data['query']['pages'][page_id]
-                if 'revisions' in page_data:
-                    return page_data['revisions']
+                # Callers expect chronological order
+                return {'revisions': page_data.get('revisions', [])[::-1]}
     except Exception as e:
-        print(f"Error fetching revisions for {page_title}: {e}")
+        print(f"Error fetching revisions for {title}: {e}")
     
-    return []
+    return None
+
+def iter_pages_as_completed(titles, rvlimit: int = 200):
+    """Yield (title, page) pairs in the order their fetches finish
+    
+    The API only accepts rvlimit when a single title is requested, so the
+    pages are fetched concurrently instead. Closing the generator early
+    cancels the fetches that have not started.
+    """
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {executor.submit(_fetch_page, title, rvlimit): title for title in titles}
+        for future in as_completed(futures):
+            page = future.result()
+            if page is not None:
+                yield futures[future], page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def get_page_revisions_quick(page_title: str, limit: int = 200):
+    """Get recent revisions for a page"""
+    page = _fetch_page(page_title, limit)
+    return page['revisions'] if page else []
 
 def detect_reverts_quick(revisions):
     """Quick revert detection"""
@@ -53,27 +113,28 @@ def detect_reverts_quick(revisions):
     
     for i in range(1, len(revisions)):
         current_rev = revisions[i]
-        previous_rev = revisions[i-1]
         
-        # Check for revert indicators in comment
-        comment = current_rev.get('comment', '').lower()
-        revert_indicators = ['revert', 'undo', 'rv', 'rollback', 'restore', 'reverted']
+        # Check for revert indicators in comment; most edits have none
+        comment = current_rev.get('comment') or ''
+        if not comment or not _REVERT_RE.search(comment):
+            continue
         
-        if any(indicator in comment for indicator in revert_indicators):
-            reverts.append({
-                'timestamp': current_rev['timestamp'],
-                'user': current_rev.get('user', 'Anonymous'),
-                'comment': current_rev.get('comment', ''),
-                'size': current_rev.get('size', 0)
-            })
+        reverts.append({
+            'timestamp': current_rev['timestamp'],
+            'user': current_rev.get('user', 'Anonymous'),
+            'comment': comment,
+            'size': current_rev.get('size', 0),
+            '_ts': datetime.fromisoformat(current_rev['timestamp'].replace('Z', '+00:00'))
+        })
     
     return reverts
 
-def analyze_edit_war_patterns_quick(page_title: str):
+def analyze_edit_war_patterns_quick(page_title: str, revisions=None):
     """Quick edit war analysis for a single page"""
     print(f"Analyzing: {page_title}")
     
-    revisions = get_page_revisions_quick(page_title, limit=200)
+    if revisions is None:
+        revisions = get_page_revisions_quick(page_title, limit=200)
     if not revisions:
         return None
     
@@ -83,24 +144,19 @@ def analyze_edit_war_patterns_quick(page_title: str):
         return None
     
     # Analyze revert patterns
-    revert_times = [datetime.fromisoformat(r['timestamp'].replace('Z', '+00:00')) for r in reverts]
     revert_users = [r['user'] for r in reverts]
     
     # Group reverts by time windows (24 hours)
+    # A group is the run reverts[start:end]; it closes at the first gap over 24h
     revert_groups = []
-    current_group = [reverts[0]]
+    start = 0
     
-    for i in range(1, len(reverts)):
-        time_diff = (revert_times[i] - revert_times[i-1]).total_seconds() / 3600
-        if time_diff <= 24:
-            current_group.append(reverts[i])
-        else:
-            if len(current_group) >= 3:
-                revert_groups.append(current_group)
-            current_group = [reverts[i]]
-    
-    if len(current_group) >= 3:
-        revert_groups.append(current_group)
+    for end in range(1, len(reverts) + 1):
+        if end < len(reverts) and (reverts[end]['_ts'] - reverts[end-1]['_ts']).total_seconds() <= 24 * 3600:
+            continue
+        if end - start >= 3:
+            revert_groups.append(reverts[start:end])
+        start = end
     
     if not revert_groups:
         return None
@@ -108,25 +164,23 @@ def analyze_edit_war_patterns_quick(page_title: str):
     # Analyze each edit war group
     edit_wars = []
     for group in revert_groups:
-        start_time = datetime.fromisoformat(group[0]['timestamp'].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(group[-1]['timestamp'].replace('Z', '+00:00'))
-        duration = (end_time - start_time).total_seconds() / 3600
+        duration = (group[-1]['_ts'] - group[0]['_ts']).total_seconds() / 3600
         
-        users = list(set([r['user'] for r in group]))
+        # Reverts per editor within this war
+        editor_counter = Counter(r['user'] for r in group)
         
         # Calculate intervals
         intervals = []
         for i in range(1, len(group)):
-            current_time = datetime.fromisoformat(group[i]['timestamp'].replace('Z', '+00:00'))
-            prev_time = datetime.fromisoformat(group[i-1]['timestamp'].replace('Z', '+00:00'))
-            interval = (current_time - prev_time).total_seconds() / 60
+            interval = (group[i]['_ts'] - group[i-1]['_ts']).total_seconds() / 60
             intervals.append(interval)
         
         edit_wars.append({
             'revert_count': len(group),
             'duration_hours': duration,
-            'unique_editors': len(users),
-            'editors': users,
+            'unique_editors': len(editor_counter),
+            'editors': list(editor_counter),
+            'editor_counts': editor_counter,
             'avg_interval_minutes': sum(intervals) / len(intervals) if intervals else 0,
             'start_time': group[0]['timestamp'],
             'end_time': group[-1]['timestamp']
@@ -159,22 +213,22 @@ def find_contested_articles_quick(limit: int = 30):
     }
     
     try:
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        response = session.get(api_url, params=params)
+        data = _decode_json(response)
         
         if 'query' in data and 'random' in data['query']:
-            pages = data['query']['random']
+            titles = [page['title'] for page in data['query']['random']]
             
-            for page in pages:
-                title = page['title']
-                analysis = analyze_edit_war_patterns_quick(title)
+            # Analyze each page as soon as it arrives rather than waiting for the slowest
+            pages = iter_pages_as_completed(titles, rvlimit=200)
+            for title, page in pages:
+                analysis = analyze_edit_war_patterns_quick(title, page['revisions'])
                 
                 if analysis and analysis['edit_wars']:
                     contested_articles.append(analysis)
                 
-                time.sleep(0.1)  # Be respectful to the API
-                
                 if len(contested_articles) >= 10:  # Limit to 10 for quick analysis
+                    pages.close()
                     break
     
     except Exception as e:
@@ -198,8 +252,8 @@ def analyze_editor_behavior_quick(contested_articles):
     # Analyze editor experience (simplified)
     editor_counts = Counter(all_editors)
     
-    new_editors = len([e for e in editor_counts.values() if e == 1])
-    repeat_editors = len([e for e in editor_counts.values() if e > 1])
+    new_editors = sum(1 for count in editor_counts.values() if count == 1)
+    repeat_editors = sum(1 for count in editor_counts.values() if count > 1)
     
     return {
         'total_unique_editors': len(editor_counts),
@@ -216,8 +270,7 @@ def detect_three_revert_violations_quick(contested_articles):
     for article in contested_articles:
         for war in article['edit_wars']:
             # Check if any editor made 3+ reverts in 24 hours
-            editor_revert_counts = Counter(war['editors'])
-            for editor, count in editor_revert_counts.items():
+            for editor, count in war['editor_counts'].items():
                 if count >= 3:
                     violations.append({
                         'article': article['title'],
@@ -264,27 +317,20 @@ def main():
     
     # Edit war characteristics
     print(f"\n=== EDIT WAR CHARACTERISTICS ===")
-    all_durations = []
-    all_intervals = []
-    all_editor_counts = []
+    all_wars = [war for article in contested_articles for war in article['edit_wars']]
     
-    for article in contested_articles:
-        for war in article['edit_wars']:
-            all_durations.append(war['duration_hours'])
-            all_intervals.append(war['avg_interval_minutes'])
-            all_editor_counts.append(war['unique_editors'])
-    
-    if all_durations:
-        print(f"Average edit war duration: {sum(all_durations) / len(all_durations):.1f} hours")
-        print(f"Median edit war duration: {sorted(all_durations)[len(all_durations)//2]:.1f} hours")
-    
-    if all_intervals:
-        print(f"Average revert interval: {sum(all_intervals) / len(all_intervals):.1f} minutes")
-        print(f"Median revert interval: {sorted(all_intervals)[len(all_intervals)//2]:.1f} minutes")
-    
-    if all_editor_counts:
-        print(f"Average editors per edit war: {sum(all_editor_counts) / len(all_editor_counts):.1f}")
-        print(f"Median editors per edit war: {sorted(all_editor_counts)[len(all_editor_counts)//2]}")
+    if all_wars:
+        durations = np.fromiter((war['duration_hours'] for war in all_wars), dtype=np.float64, count=len(all_wars))
+        intervals = np.fromiter((war['avg_interval_minutes'] for war in all_wars), dtype=np.float64, count=len(all_wars))
+        editor_counts = np.fromiter((war['unique_editors'] for war in all_wars), dtype=np.int64, count=len(all_wars))
+        
+        # method='higher' keeps the upper-middle value for even-sized samples
+        print(f"Average edit war duration: {durations.mean():.1f} hours")
+        print(f"Median edit war duration: {np.percentile(durations, 50, method='higher'):.1f} hours")
+        print(f"Average revert interval: {intervals.mean():.1f} minutes")
+        print(f"Median revert interval: {np.percentile(intervals, 50, method='higher'):.1f} minutes")
+        print(f"Average editors per edit war: {editor_counts.mean():.1f}")
+        print(f"Median editors per edit war: {np.percentile(editor_counts, 50, method='higher')}")
     
     # Editor behavior analysis
     print(f"\n=== EDITOR BEHAVIOR PATTERNS ===")
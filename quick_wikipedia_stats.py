@@ -12,9 +12,70 @@ This script provides quick answers to basic Wikipedia questions:
 import requests
 import json
 import time
+from datetime import timedelta
+from urllib.parse import quote
+
+try:
+    import requests_cache  # Optional on-disk cache for API responses
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # Optional fast JSON decoder
+except ImportError:
+    orjson = None
+
+if requests_cache is not None:
+    # Reruns within the hour are served from the local cache
+    # API errors (e.g. maxlag) also come back as 200s, so skip anything flagged with an error header
+    session = requests_cache.CachedSession('wiki_cache', backend='sqlite',
+                                           expire_after=timedelta(hours=1),
+                                           allowable_codes=(200,),
+                                           filter_fn=lambda r: 'MediaWiki-API-Error' not in r.headers)
+else:
+    session = requests.Session()
+session.headers.update({
+    'User-Agent': 'QuickWikipediaStats/1.0 (Educational Research Project)'
+})
+
+def _decode_json(response):
+    """Decode an API response, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def get_page_edit_counts(titles):
+    """Get edit counts for many pages
+    
+    The action API has no revision count, so each title is looked up on the
+    REST history endpoint (which stops counting at 30,000).
+    """
+    rest_api_url = "https://en.wikipedia.org/w/rest.php/v1"
+    edit_counts = {}
+    
+    for i, title in enumerate(titles):
+        if i:
+            time.sleep(0.1)  # Be respectful to the API
+        
+        url = f"{rest_api_url}/page/{quote(title.replace(' ', '_'), safe='')}/history/counts/edits"
+        response = session.get(url)
+        if response.status_code != 200:
+            continue  # Missing or invalid title
+        edit_counts[title] = _decode_json(response).get('count', 0)
+    
+    return edit_counts
 
 def get_wikipedia_basic_stats():
     """Get basic Wikipedia statistics"""
+    stats, _ = get_basic_stats_and_sample()
+    return stats
+
+def get_basic_stats_and_sample(sample_size=0):
+    """Get basic Wikipedia statistics along with random article titles
+    
+    When sample_size is set, the random titles are requested in the same query
+    as the statistics. Returns (stats, pages), or (None, []) on error.
+    """
     print("Fetching Wikipedia statistics...")
     
     api_url = "https://en.wikipedia.org/w/api.php"
@@ -26,10 +87,12 @@ def get_wikipedia_basic_stats():
         'meta': 'siteinfo',
         'siprop': 'statistics'
     }
+    if sample_size:
+        params.update(_random_pages_params(sample_size))
     
     try:
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        response = session.get(api_url, params=params)
+        data = _decode_json(response)
         
         if 'query' in data and 'statistics' in data['query']:
             stats = data['query']['statistics']
@@ -43,81 +106,69 @@ def get_wikipedia_basic_stats():
             print(f"Administrators: {stats.get('admins', 'N/A'):,}")
             print(f"Images: {stats.get('images', 'N/A'):,}")
             
-            return stats
+            return stats, data['query'].get('random', [])
     except Exception as e:
         print(f"Error fetching statistics: {e}")
-        return None
-
-def get_sample_page_stats(sample_size=10):
-    """Get statistics from a sample of random pages"""
-    print(f"\nAnalyzing {sample_size} random pages for content statistics...")
-    
-    api_url = "https://en.wikipedia.org/w/api.php"
     
-    # Get random pages
-    params = {
-        'action': 'query',
-        'format': 'json',
+    return None, []
+
+def _random_pages_params(sample_size):
+    """Query parameters for a sample of random articles"""
+    return {
         'list': 'random',
         'rnnamespace': 0,  # Main namespace (articles only)
         'rnlimit': min(sample_size, 500),
         'rnfilterredir': 'nonredirects'
     }
+
+def get_sample_page_stats(sample_size=10, pages=None):
+    """Get statistics from a sample of random pages
+    
+    Pass pages to reuse random titles fetched by get_basic_stats_and_sample.
+    """
+    print(f"\nAnalyzing {sample_size} random pages for content statistics...")
+    
+    api_url = "https://en.wikipedia.org/w/api.php"
     
     try:
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        if not pages:
+            # Get random pages
+            params = {'action': 'query', 'format': 'json', **_random_pages_params(sample_size)}
+            response = session.get(api_url, params=params)
+            data = _decode_json(response)
+            pages = data['query']['random'] if 'query' in data and 'random' in data['query'] else []
         
-        if 'query' in data and 'random' in data['query']:
-            pages = data['query']['random']
-            
+        if pages:
             word_counts = []
-            edit_counts = []
             
             for page in pages:
                 title = page['title']
                 print(f"Analyzing: {title}")
                 
-                # Get page content
+                # Get page content as plain text
                 content_params = {
-                    'action': 'parse',
-                    'format': 'json',
-                    'page': title,
-                    'prop': 'text'
-                }
-                
-                content_response = requests.get(api_url, params=content_params)
-                content_data = content_response.json()
-                
-                if 'parse' in content_data and 'text' in content_data['parse']:
-                    text = content_data['parse']['text']['*']
-                    # Remove HTML tags for word count
-                    import re
-                    clean_text = re.sub(r'<[^>]+>', '', text)
-                    word_count = len(clean_text.split())
-                    word_counts.append(word_count)
-                
-                # Get edit count
-                edit_params = {
                     'action': 'query',
                     'format': 'json',
-                    'prop': 'info',
-                    'titles': title,
-                    'inprop': 'editcount'
+                    'prop': 'extracts',
+                    'explaintext': 1,
+                    'titles': title
                 }
                 
-                edit_response = requests.get(api_url, params=edit_params)
-                edit_data = edit_response.json()
+                content_response = session.get(api_url, params=content_params)
+                content_data = _decode_json(content_response)
                 
-                if 'query' in edit_data and 'pages' in edit_data['query']:
-                    page_id = list(edit_data['query']['pages'].keys())[0]
-                    if page_id != '-1':
-                        page_data = edit_data['query']['pages'][page_id]
-                        edit_count = page_data.get('editcount', 0)
-                        edit_counts.append(edit_count)
+                if 'query' in content_data and 'pages' in content_data['query']:
+                    for page_data in content_data['query']['pages'].values():
+                        if 'extract' in page_data:
+                            word_counts.append(len(page_data['extract'].split()))
                 
                 time.sleep(0.1)  # Be respectful to the API
             
+            # Get edit counts for the sampled pages
+            titles = [page['title'] for page in pages]
+            page_edit_counts = get_page_edit_counts(titles)
+            edit_counts = [page_edit_counts[title] for title in titles if title in page_edit_counts]
+            
             if word_counts:
                 avg_words = sum(word_counts) / len(word_counts)
                 median_words = sorted(word_counts)[len(word_counts)//2]
@@ -156,42 +207,25 @@ def get_controversial_pages_quick():
     }
     
     try:
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        response = session.get(api_url, params=params)
+        data = _decode_json(response)
         
         if 'query' in data and 'allpages' in data['query']:
             pages = data['query']['allpages']
             
             controversial_candidates = []
             
-            for page in pages[:20]:  # Check first 20 pages
-                title = page['title']
-                
-                # Get edit count
-                edit_params = {
-                    'action': 'query',
-                    'format': 'json',
-                    'prop': 'info',
-                    'titles': title,
-                    'inprop': 'editcount'
-                }
-                
-                edit_response = requests.get(api_url, params=edit_params)
-                edit_data = edit_response.json()
-                
-                if 'query' in edit_data and 'pages' in edit_data['query']:
-                    page_id = list(edit_data['query']['pages'].keys())[0]
-                    if page_id != '-1':
-                        page_data = edit_data['query']['pages'][page_id]
-                        edit_count = page_data.get('editcount', 0)
-                        
-                        if edit_count > 100:  # High edit count threshold
-                            controversial_candidates.append({
-                                'title': title,
-                                'edit_count': edit_count
-                            })
+            titles = [page['title'] for page in pages[:20]]  # Check first 20 pages
+            edit_counts = get_page_edit_counts(titles)
+            
+            for title in titles:
+                edit_count = edit_counts.get(title)
                 
-                time.sleep(0.1)
+                if edit_count is not None and edit_count > 100:  # High edit count threshold
+                    controversial_candidates.append({
+                        'title': title,
+                        'edit_count': edit_count
+                    })
             
             if controversial_candidates:
                 controversial_candidates.sort(key=lambda x: x['edit_count'], reverse=True)
@@ -208,11 +242,11 @@ def main():
     print("Quick Wikipedia Statistics Tool")
     print("=" * 40)
     
-    # Get basic statistics
-    stats = get_wikipedia_basic_stats()
+    # Get basic statistics and the random sample in one request
+    stats, sample_pages = get_basic_stats_and_sample(sample_size=15)
     
     # Get sample page statistics
-    get_sample_page_stats(sample_size=15)
+    get_sample_page_stats(sample_size=15, pages=sample_pages)
     
     # Find controversial pages
     get_controversial_pages_quick()
@@ -12,22 +12,32 @@ This script analyzes various aspects of Wikipedia including:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+from datetime import datetime
 import numpy as np
 from collections import Counter, defaultdict
 import re
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 import logging
 
+try:
+    import orjson  # Optional fast JSON encoder/decoder
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Section headings in a plain-text extract, e.g. "== History ==" or "=== Early life ==="
+_SECTION_HEADING_RE = re.compile(r'^=+ .+ =+$', re.MULTILINE)
+
 class WikipediaAnalyzer:
     """Comprehensive Wikipedia analysis tool"""
     
@@ -35,10 +45,34 @@ class WikipediaAnalyzer:
         self.language = language
         self.base_url = f"https://{language}.wikipedia.org/api/rest_v1"
         self.api_url = f"https://{language}.wikipedia.org/w/api.php"
+        self.rest_api_url = f"https://{language}.wikipedia.org/w/rest.php/v1"
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WikipediaAnalyzer/1.0 (Educational Research Project)'
         })
+        
+        self.max_workers = 8  # Pages analyzed concurrently; stay well under ~10 to avoid API errors
+        
+        # Reuse pooled keep-alive connections across threads and retry throttled or failed requests
+        retry = Retry(total=5, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True, allowed_methods=["GET"])
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry))
+        
+        # In-process caches so pages revisited within a run are not re-fetched
+        self.cache_ttl = 300  # Seconds before cached results are re-fetched
+        self._edit_history_cache = {}  # (title, limit) -> (fetch time, edits)
+        self._content_stats_cache = {}  # title -> (fetch time, stats)
+        
+        # Page evolution reports keep summaries rather than one entry per revision
+        self.evolution_curve_points = 100  # Samples kept from each page's size curve
+        self.evolution_top_editors = 20  # Most frequent editors kept per page
+    
+    def _get_json(self, params: Dict) -> Dict:
+        """Issue an API request and decode the JSON response"""
+        response = self.session.get(self.api_url, params=params)
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
     
     def get_wikipedia_statistics(self) -> Dict:
         """Get overall Wikipedia statistics"""
@@ -54,8 +88,7 @@ class WikipediaAnalyzer:
                 'meta': 'siteinfo',
                 'siprop': 'statistics'
             }
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'statistics' in data['query']:
                 stats_data = data['query']['statistics']
@@ -91,8 +124,7 @@ class WikipediaAnalyzer:
         }
         
         try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'random' in data['query']:
                 pages = data['query']['random']
@@ -103,7 +135,18 @@ class WikipediaAnalyzer:
         return pages
     
     def get_page_content_stats(self, page_title: str) -> Dict:
-        """Get content statistics for a specific page"""
+        """Get content statistics for a specific page, served from cache while fresh"""
+        cached = self._content_stats_cache.get(page_title)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return dict(cached[1])
+        
+        stats = self._fetch_page_content_stats(page_title)
+        if stats['word_count']:  # Don't cache failed fetches
+            self._content_stats_cache[page_title] = (time.monotonic(), stats)
+        return dict(stats)
+    
+    def _fetch_page_content_stats(self, page_title: str) -> Dict:
+        """Fetch content statistics for a page from the API"""
         logger.info(f"Analyzing page: {page_title}")
         
         stats = {
@@ -120,83 +163,74 @@ class WikipediaAnalyzer:
         }
         
         try:
-            # Get page content
+            # Get page content as plain text, its links and images and latest edit
             params = {
-                'action': 'parse',
-                'format': 'json',
-                'page': page_title,
-                'prop': 'text|sections|links|images|externallinks'
-            }
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
-            
-            if 'parse' in data:
-                parse_data = data['parse']
-                
-                # Get text content
-                if 'text' in parse_data and '*' in parse_data['text']:
-                    text = parse_data['text']['*']
-                    # Remove HTML tags for word count
-                    clean_text = re.sub(r'<[^>]+>', '', text)
-                    stats['word_count'] = len(clean_text.split())
-                    stats['char_count'] = len(clean_text)
-                
-                # Count sections
-                if 'sections' in parse_data:
-                    stats['section_count'] = len(parse_data['sections'])
-                
-                # Count links
-                if 'links' in parse_data:
-                    stats['link_count'] = len(parse_data['links'])
-                
-                # Count images
-                if 'images' in parse_data:
-                    stats['image_count'] = len(parse_data['images'])
-            
-            # Get edit history
-            edit_params = {
                 'action': 'query',
                 'format': 'json',
-                'prop': 'revisions',
+                'prop': 'extracts|links|images|revisions',
                 'titles': page_title,
-                'rvprop': 'timestamp|user|comment',
-                'rvlimit': 1,
-                'rvdir': 'newer'
+                'explaintext': 1,
+                'exsectionformat': 'wiki',  # Keep "== Heading ==" lines so sections can be counted
+                'rvprop': 'timestamp',  # Latest revision only
+                'pllimit': 'max',
+                'imlimit': 'max'
             }
-            edit_response = self.session.get(self.api_url, params=edit_params)
-            edit_data = edit_response.json()
-            
-            if 'query' in edit_data and 'pages' in edit_data['query']:
-                page_id = list(edit_data['query']['pages'].keys())[0]
-                if page_id != '-1':  # Page exists
-                    page_data = edit_data['query']['pages'][page_id]
-                    if 'revisions' in page_data:
-                        stats['last_edit'] = page_data['revisions'][0]['timestamp']
             
-            # Get total edit count
-            edit_count_params = {
-                'action': 'query',
-                'format': 'json',
-                'prop': 'info',
-                'titles': page_title,
-                'inprop': 'editcount'
-            }
-            edit_count_response = self.session.get(self.api_url, params=edit_count_params)
-            edit_count_data = edit_count_response.json()
+            # Long link or image lists arrive over several continued responses
+            while True:
+                data = self._get_json(params)
+                
+                if 'query' in data and 'pages' in data['query']:
+                    for page_data in data['query']['pages'].values():
+                        # Get text content
+                        if 'extract' in page_data:
+                            text = page_data['extract']
+                            stats['word_count'] = len(text.split())
+                            stats['char_count'] = len(text)
+                            stats['section_count'] = len(_SECTION_HEADING_RE.findall(text))
+                        
+                        # Count links and images
+                        stats['link_count'] += len(page_data.get('links', []))
+                        stats['image_count'] += len(page_data.get('images', []))
+                        
+                        # Get latest edit
+                        if page_data.get('revisions'):
+                            stats['last_edit'] = page_data['revisions'][0]['timestamp']
+                
+                if 'continue' not in data:
+                    break
+                params.update(data['continue'])
             
-            if 'query' in edit_count_data and 'pages' in edit_count_data['query']:
-                page_id = list(edit_count_data['query']['pages'].keys())[0]
-                if page_id != '-1':
-                    page_data = edit_count_data['query']['pages'][page_id]
-                    stats['edit_count'] = page_data.get('editcount', 0)
+            # The action API has no revision count, so ask the REST history endpoint
+            stats['edit_count'] = self._get_edit_count(page_title)
         
         except Exception as e:
             logger.error(f"Error analyzing page {page_title}: {e}")
         
         return stats
     
+    def _get_edit_count(self, page_title: str) -> int:
+        """Get a page's total number of edits (the endpoint stops counting at 30,000)"""
+        url = f"{self.rest_api_url}/page/{quote(page_title.replace(' ', '_'), safe='')}/history/counts/edits"
+        response = self.session.get(url)
+        response.raise_for_status()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        return data.get('count', 0)
+    
     def get_edit_history(self, page_title: str, limit: int = 100) -> List[Dict]:
-        """Get detailed edit history for a page"""
+        """Get detailed edit history for a page, served from cache while fresh"""
+        key = (page_title, limit)
+        cached = self._edit_history_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+        
+        edits = self._fetch_edit_history(page_title, limit)
+        if edits:
+            self._edit_history_cache[key] = (time.monotonic(), edits)
+        return list(edits)
+    
+    def _fetch_edit_history(self, page_title: str, limit: int) -> List[Dict]:
+        """Fetch edit history for a page from the API"""
         logger.info(f"Fetching edit history for: {page_title}")
         
         edits = []
@@ -211,11 +245,10 @@ class WikipediaAnalyzer:
         }
         
         try:
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'pages' in data['query']:
-                page_id = list(data['query']['pages'].keys())[0]
+                page_id = next(iter(data['query']['pages']))
                 if page_id != '-1':
                     page_data = data['query']['pages'][page_id]
                     if 'revisions' in page_data:
@@ -245,41 +278,44 @@ class WikipediaAnalyzer:
         try:
             # This is a simplified approach - in practice, you'd want to analyze
             # edit patterns, talk page activity, and other indicators
-            response = self.session.get(self.api_url, params=params)
-            data = response.json()
+            data = self._get_json(params)
             
             if 'query' in data and 'allpages' in data['query']:
-                pages = data['query']['allpages']
+                titles = [page['title'] for page in data['query']['allpages'][:limit]]
                 
-                # Analyze each page for controversy indicators
-                for page in pages[:limit]:
-                    title = page['title']
-                    
-                    # Get edit history to analyze patterns
-                    edits = self.get_edit_history(title, limit=50)
-                    
+                # Fetch edit histories concurrently to analyze patterns
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    histories = list(executor.map(lambda title: self.get_edit_history(title, limit=50), titles))
+                
+                # Calculate controversy indicators for each page
+                cutoff = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=30)
+                scored_titles = []
+                indicators = []  # (edit_count, unique_editors, recent_edits) per page
+                for title, edits in zip(titles, histories):
                     if edits:
-                        # Calculate controversy indicators
-                        edit_count = len(edits)
-                        unique_editors = len(set(edit['user'] for edit in edits if 'user' in edit))
-                        recent_edits = len([e for e in edits if 'timestamp' in e and 
-                                          datetime.fromisoformat(e['timestamp'].replace('Z', '+00:00')) > 
-                                          datetime.now().replace(tzinfo=None) - timedelta(days=30)])
-                        
-                        controversy_score = (edit_count * 0.3 + 
-                                           unique_editors * 0.4 + 
-                                           recent_edits * 0.3)
-                        
-                        if controversy_score > 10:  # Threshold for "controversial"
-                            controversial_pages.append({
-                                'title': title,
-                                'edit_count': edit_count,
-                                'unique_editors': unique_editors,
-                                'recent_edits': recent_edits,
-                                'controversy_score': controversy_score
-                            })
-                    
-                    time.sleep(0.1)  # Be respectful to the API
+                        editors = set()
+                        timestamps = []
+                        for edit in edits:  # One pass collects both editors and timestamps
+                            if 'user' in edit:
+                                editors.add(edit['user'])
+                            if 'timestamp' in edit:
+                                timestamps.append(edit['timestamp'])
+                        recent_edits = int((pd.to_datetime(timestamps, utc=True) > cutoff).sum())
+                        scored_titles.append(title)
+                        indicators.append((len(edits), len(editors), recent_edits))
+                
+                # Score every page at once
+                if indicators:
+                    counts = np.array(indicators, dtype=np.int64)
+                    scores = counts @ np.array([0.3, 0.4, 0.3])
+                    for i in np.flatnonzero(scores > 10):  # Threshold for "controversial"
+                        controversial_pages.append({
+                            'title': scored_titles[i],
+                            'edit_count': int(counts[i, 0]),
+                            'unique_editors': int(counts[i, 1]),
+                            'recent_edits': int(counts[i, 2]),
+                            'controversy_score': float(scores[i])
+                        })
         
         except Exception as e:
             logger.error(f"Error finding controversial pages: {e}")
@@ -297,7 +333,9 @@ class WikipediaAnalyzer:
             'creation_date': None,
             'total_edits': 0,
             'size_growth': [],
-            'editor_diversity': [],
+            'size_growth_edits': [],
+            'size_stats': {},
+            'editor_diversity': {},
             'edit_frequency': [],
             'major_changes': []
         }
@@ -313,37 +351,44 @@ class WikipediaAnalyzer:
                 if edits:
                     evolution['creation_date'] = edits[0]['timestamp']
                 
-                # Analyze size changes
-                sizes = [edit.get('size', 0) for edit in edits if 'size' in edit]
-                evolution['size_growth'] = sizes
+                # Analyze size changes; keep a down-sampled curve that includes both ends
+                sizes = np.fromiter((edit.get('size', 0) for edit in edits), dtype=np.int64, count=len(edits))
+                curve_points = min(len(sizes), self.evolution_curve_points)
+                curve_edits = np.unique(np.linspace(0, len(sizes) - 1, curve_points).round().astype(np.int64))
+                evolution['size_growth'] = sizes[curve_edits].tolist()
+                evolution['size_growth_edits'] = curve_edits.tolist()
+                evolution['size_stats'] = {
+                    'min': int(sizes.min()),
+                    'max': int(sizes.max()),
+                    'mean': float(sizes.mean()),
+                    'median': float(np.median(sizes))
+                }
                 
-                # Analyze editor diversity over time
-                editors = [edit.get('user', 'Anonymous') for edit in edits if 'user' in edit]
-                evolution['editor_diversity'] = editors
+                # Analyze editor diversity
+                editors = Counter(edit['user'] for edit in edits if 'user' in edit)
+                evolution['editor_diversity'] = {
+                    'unique_editors': len(editors),
+                    'top_editors': editors.most_common(self.evolution_top_editors)
+                }
                 
                 # Calculate edit frequency
                 if len(edits) > 1:
-                    timestamps = [datetime.fromisoformat(edit['timestamp'].replace('Z', '+00:00')) 
-                                for edit in edits if 'timestamp' in edit]
-                    timestamps.sort()
+                    timestamps = pd.to_datetime([edit['timestamp'] for edit in edits if 'timestamp' in edit],
+                                                utc=True).sort_values()
                     
-                    # Calculate days between edits
-                    edit_intervals = []
-                    for i in range(1, len(timestamps)):
-                        interval = (timestamps[i] - timestamps[i-1]).days
-                        edit_intervals.append(interval)
+                    # Calculate whole days between edits (independent of the index's ns/us unit)
+                    edit_intervals = np.diff(timestamps.values).astype('timedelta64[D]').astype(np.int64)
                     
-                    evolution['edit_frequency'] = edit_intervals
+                    evolution['edit_frequency'] = edit_intervals.tolist()
                 
                 # Identify major changes (large size changes)
-                for i in range(1, len(sizes)):
-                    size_change = sizes[i] - sizes[i-1]
-                    if abs(size_change) > 1000:  # Major change threshold
-                        evolution['major_changes'].append({
-                            'edit_index': i,
-                            'size_change': size_change,
-                            'timestamp': edits[i]['timestamp'] if 'timestamp' in edits[i] else None
-                        })
+                size_changes = np.diff(sizes)
+                for i in np.flatnonzero(np.abs(size_changes) > 1000):  # Major change threshold
+                    evolution['major_changes'].append({
+                        'edit_index': int(i) + 1,
+                        'size_change': int(size_changes[i]),
+                        'timestamp': edits[i + 1].get('timestamp')
+                    })
         
         except Exception as e:
             logger.error(f"Error analyzing page evolution: {e}")
@@ -369,32 +414,28 @@ class WikipediaAnalyzer:
         # Get random pages for content analysis
         random_pages = self.get_random_pages(sample_size)
         
-        # Analyze content statistics
-        for page in random_pages[:min(20, len(random_pages))]:  # Limit to 20 for performance
-            content_stats = self.get_page_content_stats(page['title'])
-            report['content_stats'].append(content_stats)
-            time.sleep(0.1)  # Be respectful to the API
+        # Analyze content statistics; pages are independent, so overlap their round trips
+        content_titles = [page['title'] for page in random_pages[:20]]  # Limit to 20 for performance
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            report['content_stats'] = list(executor.map(self.get_page_content_stats, content_titles))
         
         # Find controversial pages
         report['controversial_pages'] = self.find_controversial_pages(limit=10)
         
         # Analyze page evolution for a few sample pages
         sample_titles = [page['title'] for page in random_pages[:5]]
-        for title in sample_titles:
-            evolution = self.analyze_page_evolution(title)
-            report['evolution_analysis'].append(evolution)
-            time.sleep(0.1)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            report['evolution_analysis'] = list(executor.map(self.analyze_page_evolution, sample_titles))
         
         # Generate summary statistics
         if report['content_stats']:
-            word_counts = [stats['word_count'] for stats in report['content_stats']]
-            edit_counts = [stats['edit_count'] for stats in report['content_stats']]
+            agg = pd.DataFrame(report['content_stats'])[['word_count', 'edit_count']].agg(['mean', 'median'])
             
             report['summary'] = {
-                'avg_words_per_page': np.mean(word_counts),
-                'median_words_per_page': np.median(word_counts),
-                'avg_edits_per_page': np.mean(edit_counts),
-                'median_edits_per_page': np.median(edit_counts),
+                'avg_words_per_page': agg.at['mean', 'word_count'],
+                'median_words_per_page': agg.at['median', 'word_count'],
+                'avg_edits_per_page': agg.at['mean', 'edit_count'],
+                'median_edits_per_page': agg.at['median', 'edit_count'],
                 'total_pages_analyzed': len(report['content_stats'])
             }
         
@@ -405,15 +446,29 @@ class WikipediaAnalyzer:
         if filename is None:
             filename = f"wikipedia_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                     orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Report saved to {filename}")
         return filename
     
+    @staticmethod
+    def _plot_histogram(ax, values: np.ndarray, bins):
+        """Bin values with np.histogram and draw the counts as bars"""
+        counts, edges = np.histogram(values, bins=bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, edgecolor='black')
+    
     def create_visualizations(self, report: Dict, output_dir: str = "wikipedia_analysis"):
         """Create visualizations from the analysis report"""
         import os
+        # Plotting libraries are only needed here; keep them off the report path
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         os.makedirs(output_dir, exist_ok=True)
         
         # Set up plotting style
@@ -422,55 +477,57 @@ class WikipediaAnalyzer:
         
         # 1. Word count distribution
         if report['content_stats']:
-            word_counts = [stats['word_count'] for stats in report['content_stats']]
+            word_counts = np.fromiter((stats['word_count'] for stats in report['content_stats']),
+                                      dtype=np.int64, count=len(report['content_stats']))
             
-            plt.figure(figsize=(12, 8))
-            plt.subplot(2, 2, 1)
-            plt.hist(word_counts, bins=20, alpha=0.7, edgecolor='black')
-            plt.title('Distribution of Words per Page')
-            plt.xlabel('Word Count')
-            plt.ylabel('Frequency')
-            plt.axvline(np.mean(word_counts), color='red', linestyle='--', 
-                       label=f'Mean: {np.mean(word_counts):.0f}')
-            plt.legend()
+            fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+            self._plot_histogram(axes[0, 0], word_counts, bins=20)
+            axes[0, 0].set_title('Distribution of Words per Page')
+            axes[0, 0].set_xlabel('Word Count')
+            axes[0, 0].set_ylabel('Frequency')
+            axes[0, 0].axvline(word_counts.mean(), color='red', linestyle='--', 
+                               label=f'Mean: {word_counts.mean():.0f}')
+            axes[0, 0].legend()
             
             # 2. Edit count distribution
-            edit_counts = [stats['edit_count'] for stats in report['content_stats']]
+            edit_counts = np.fromiter((stats['edit_count'] for stats in report['content_stats']),
+                                      dtype=np.int64, count=len(report['content_stats']))
             
-            plt.subplot(2, 2, 2)
-            plt.hist(edit_counts, bins=20, alpha=0.7, edgecolor='black')
-            plt.title('Distribution of Edits per Page')
-            plt.xlabel('Edit Count')
-            plt.ylabel('Frequency')
-            plt.axvline(np.mean(edit_counts), color='red', linestyle='--',
-                       label=f'Mean: {np.mean(edit_counts):.0f}')
-            plt.legend()
+            self._plot_histogram(axes[0, 1], edit_counts, bins=20)
+            axes[0, 1].set_title('Distribution of Edits per Page')
+            axes[0, 1].set_xlabel('Edit Count')
+            axes[0, 1].set_ylabel('Frequency')
+            axes[0, 1].axvline(edit_counts.mean(), color='red', linestyle='--',
+                               label=f'Mean: {edit_counts.mean():.0f}')
+            axes[0, 1].legend()
             
             # 3. Controversial pages
             if report['controversial_pages']:
-                plt.subplot(2, 2, 3)
                 titles = [page['title'][:20] + '...' if len(page['title']) > 20 
                          else page['title'] for page in report['controversial_pages'][:10]]
                 scores = [page['controversy_score'] for page in report['controversial_pages'][:10]]
                 
-                plt.barh(range(len(titles)), scores)
-                plt.yticks(range(len(titles)), titles)
-                plt.title('Top Controversial Pages')
-                plt.xlabel('Controversy Score')
+                axes[1, 0].barh(range(len(titles)), scores)
+                axes[1, 0].set_yticks(range(len(titles)))
+                axes[1, 0].set_yticklabels(titles)
+                axes[1, 0].set_title('Top Controversial Pages')
+                axes[1, 0].set_xlabel('Controversy Score')
+            else:
+                axes[1, 0].axis('off')
             
             # 4. Page evolution example
-            if report['evolution_analysis']:
-                plt.subplot(2, 2, 4)
-                evolution = report['evolution_analysis'][0]
-                if evolution['size_growth']:
-                    plt.plot(evolution['size_growth'])
-                    plt.title(f'Page Size Evolution: {evolution["title"][:20]}...')
-                    plt.xlabel('Edit Number')
-                    plt.ylabel('Page Size (bytes)')
+            evolution = report['evolution_analysis'][0] if report['evolution_analysis'] else None
+            if evolution and evolution['size_growth']:
+                axes[1, 1].plot(evolution['size_growth_edits'], evolution['size_growth'])
+                axes[1, 1].set_title(f'Page Size Evolution: {evolution["title"][:20]}...')
+                axes[1, 1].set_xlabel('Edit Number')
+                axes[1, 1].set_ylabel('Page Size (bytes)')
+            else:
+                axes[1, 1].axis('off')
             
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/wikipedia_analysis.png", dpi=300, bbox_inches='tight')
-            plt.show()
+            fig.tight_layout()
+            fig.savefig(f"{output_dir}/wikipedia_analysis.png", dpi=300, bbox_inches='tight')
+            plt.close(fig)  # Saved to disk; don't block on an interactive window
             
             logger.info(f"Visualizations saved to {output_dir}/")
 
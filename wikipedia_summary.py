@@ -7,21 +7,31 @@ This script provides a clear summary of the Wikipedia analysis findings.
 """
 
 import json
-import glob
 import os
 from datetime import datetime
+import pandas as pd
+
+try:
+    import orjson  # Optional fast JSON decoder
+except ImportError:
+    orjson = None
 
 def load_latest_report():
     """Load the most recent analysis report"""
-    report_files = glob.glob("wikipedia_analysis_*.json")
-    if not report_files:
+    # Get the most recent file; DirEntry.stat() reuses what the directory scan returned
+    with os.scandir('.') as entries:
+        latest = max((entry for entry in entries
+                      if entry.name.startswith('wikipedia_analysis_') and entry.name.endswith('.json')),
+                     key=lambda entry: entry.stat().st_ctime, default=None)
+    
+    if latest is None:
         print("No analysis reports found. Please run wikipedia_analysis.py first.")
         return None
     
-    # Get the most recent file
-    latest_file = max(report_files, key=os.path.getctime)
-    
-    with open(latest_file, 'r', encoding='utf-8') as f:
+    if orjson is not None:
+        with open(latest.path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(latest.path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 def print_wikipedia_summary():
@@ -52,25 +62,23 @@ def print_wikipedia_summary():
     
     # Content Analysis
     if 'content_stats' in report and report['content_stats']:
-        content_stats = report['content_stats']
-        word_counts = [page['word_count'] for page in content_stats]
-        char_counts = [page['char_count'] for page in content_stats]
-        section_counts = [page['section_count'] for page in content_stats]
-        link_counts = [page['link_count'] for page in content_stats]
-        image_counts = [page['image_count'] for page in content_stats]
+        content_df = pd.DataFrame(report['content_stats'])
+        agg = content_df[['word_count', 'char_count', 'section_count', 'link_count', 'image_count']].agg(['mean', 'min', 'max'])
+        # Upper median, matching the middle element of the sorted counts
+        median_words = content_df['word_count'].quantile(0.5, interpolation='higher')
         
         print("📝 CONTENT ANALYSIS (Sample Pages)")
         print("-" * 50)
-        print(f"📖 Average Words per Page: {sum(word_counts)/len(word_counts):.0f}")
-        print(f"📖 Median Words per Page: {sorted(word_counts)[len(word_counts)//2]}")
-        print(f"📖 Word Count Range: {min(word_counts)} - {max(word_counts)}")
+        print(f"📖 Average Words per Page: {agg.at['mean', 'word_count']:.0f}")
+        print(f"📖 Median Words per Page: {median_words:.0f}")
+        print(f"📖 Word Count Range: {agg.at['min', 'word_count']:.0f} - {agg.at['max', 'word_count']:.0f}")
         print()
-        print(f"🔤 Average Characters per Page: {sum(char_counts)/len(char_counts):.0f}")
-        print(f"🔤 Character Count Range: {min(char_counts)} - {max(char_counts)}")
+        print(f"🔤 Average Characters per Page: {agg.at['mean', 'char_count']:.0f}")
+        print(f"🔤 Character Count Range: {agg.at['min', 'char_count']:.0f} - {agg.at['max', 'char_count']:.0f}")
         print()
-        print(f"📑 Average Sections per Page: {sum(section_counts)/len(section_counts):.1f}")
-        print(f"🔗 Average Links per Page: {sum(link_counts)/len(link_counts):.1f}")
-        print(f"🖼️  Average Images per Page: {sum(image_counts)/len(image_counts):.1f}")
+        print(f"📑 Average Sections per Page: {agg.at['mean', 'section_count']:.1f}")
+        print(f"🔗 Average Links per Page: {agg.at['mean', 'link_count']:.1f}")
+        print(f"🖼️  Average Images per Page: {agg.at['mean', 'image_count']:.1f}")
         print()
     
     # Page Evolution Analysis
@@ -84,7 +92,7 @@ def print_wikipedia_summary():
             if evolution.get('creation_date'):
                 print(f"   • Created: {evolution['creation_date']}")
             if evolution.get('size_growth'):
-                print(f"   • Size Growth: {len(evolution['size_growth'])} revisions tracked")
+                print(f"   • Size Growth: {evolution['total_edits']} revisions tracked")
                 if len(evolution['size_growth']) > 1:
                     size_change = evolution['size_growth'][-1] - evolution['size_growth'][0]
                     print(f"   • Net Size Change: {size_change:+,} bytes")
@@ -11,23 +11,108 @@ This script analyzes Wikipedia user statistics:
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import random
 import time
-import matplotlib.pyplot as plt
 import numpy as np
-from collections import Counter, defaultdict
-import re
-from typing import Dict, List
+import string
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import requests_cache  # Optional on-disk cache for API responses
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # Optional fast JSON decoder
+except ImportError:
+    orjson = None
 
 API_URL = "https://en.wikipedia.org/w/api.php"
 
+# One keep-alive session for every API call
+if requests_cache is not None:
+    # Reruns within the hour are served from the local cache
+    # API errors (e.g. maxlag) also come back as 200s, so skip anything flagged with an error header
+    session = requests_cache.CachedSession('wiki_cache', backend='sqlite',
+                                           expire_after=timedelta(hours=1),
+                                           allowable_codes=(200,),
+                                           filter_fn=lambda r: 'MediaWiki-API-Error' not in r.headers)
+else:
+    session = requests.Session()
+session.headers.update({
+    'User-Agent': 'WikipediaUserStats/1.0 (Educational Research Project)'
+})
+
+MAX_WORKERS = 8  # Shards fetched concurrently; stay well under ~10 to avoid API errors
+MAXLAG = 5  # Seconds of replication lag after which the API asks us to back off
+MAXLAG_RETRIES = 3
+
+# Reuse pooled keep-alive connections across threads and back off when throttled
+retry = Retry(total=5, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504],
+              respect_retry_after_header=True, allowed_methods=["GET"])
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry))
+
+# Username first characters used to split the user list into independent shards
+USERNAME_PREFIXES = string.digits + string.ascii_uppercase
+# allusers is sorted by name, so the prefix shards plus the ranges between and after
+# them (punctuation, accented and non-Latin names, ...) cover every username
+USERNAME_SHARDS = ([{'auprefix': c} for c in USERNAME_PREFIXES] +
+                   [{'auto': '0'}, {'aufrom': ':', 'auto': 'A'}, {'aufrom': '['}])
+
+def _decode_json(response):
+    """Decode an API response, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _retry_after_seconds(response, default=MAXLAG):
+    """Read Retry-After as delay-seconds or an HTTP-date, falling back to the default"""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+def _query_api(params):
+    """Run a compact (formatversion=2) API query, waiting out maxlag errors"""
+    params = {**params, 'formatversion': 2, 'maxlag': MAXLAG}
+    for attempt in range(MAXLAG_RETRIES):
+        r = session.get(API_URL, params=params)
+        r.raise_for_status()
+        data = _decode_json(r)
+        if data.get('error', {}).get('code') != 'maxlag' or attempt == MAXLAG_RETRIES - 1:
+            return data
+        # Back off on top of Retry-After, with jitter so shards don't retry in lockstep
+        retry_after = _retry_after_seconds(r)
+        time.sleep(min(30, retry_after * 2 ** attempt + random.random()))
+
 # 1. Get total number of users
 
 def get_total_users():
-    # Use cached data from our previous analysis
-    # From our earlier analysis, we know the total users is around 49,388,388
-    print("Using cached data from previous analysis...")
-    return 49388388
+    """Get the registered user count from the site statistics"""
+    params = {
+        'action': 'query',
+        'format': 'json',
+        'meta': 'siteinfo',
+        'siprop': 'statistics'
+    }
+    try:
+        data = _query_api(params)
+        return data['query']['statistics']['users']
+    except Exception as e:
+        print(f"Error fetching site statistics: {e}")
+        return None
 
 # 2. Get edit count distribution for users
 
@@ -42,60 +127,79 @@ def get_top_users(limit=500):
         'auwitheditsonly': 1,
         'auactiveusers': 1
     }
-    r = requests.get(API_URL, params=params)
-    data = r.json()
+    data = _query_api(params)
     return data['query']['allusers']
 
-def get_edit_distribution(sample_size=100):
-    """Get real edit count data from Wikipedia API"""
-    print(f"Fetching real edit count data for {sample_size} users from Wikipedia...")
+def _get_shard_edit_counts(shard, quota, start=None):
+    """Get edit counts for up to quota users in a username shard
     
-    edit_counts = []
-    start = ''
-    fetched = 0
+    Returns the counts and the name to resume the shard from, or None once
+    the shard is exhausted.
+    """
+    edit_counts = np.empty(quota, dtype=np.int64)
+    n = 0
     
-    while fetched < sample_size:
+    while n < quota:
         params = {
             'action': 'query',
             'format': 'json',
             'list': 'allusers',
             'auprop': 'editcount',
-            'aulimit': min(50, sample_size - fetched),  # Smaller batch size
-            'aufrom': start,
-            'auwitheditsonly': 1  # Only users who have made edits
+            'aulimit': min(50, quota - n),  # Smaller batch size
+            'auwitheditsonly': 1,  # Only users who have made edits
+            **shard
         }
+        if start is not None:
+            params['aufrom'] = start
         
         try:
-            r = requests.get(API_URL, params=params)
-            if r.status_code == 429:  # Rate limited
-                print("Rate limited by Wikipedia API. Waiting 60 seconds...")
-                time.sleep(60)
-                continue
-            elif r.status_code != 200:
-                print(f"API request failed with status {r.status_code}")
-                break
-                
-            data = r.json()
+            data = _query_api(params)
             users = data['query']['allusers']
-            
-            for user in users:
-                if 'editcount' in user and user['editcount'] > 0:
-                    edit_counts.append(user['editcount'])
-                    fetched += 1
-                    if fetched >= sample_size:
-                        break
-            
-            if 'continue' in data:
-                start = data['continue']['aufrom']
-            else:
-                break
-                
-            # Be respectful - wait between requests
-            time.sleep(1)
-            
         except Exception as e:
-            print(f"Error fetching data: {e}")
-            break
+            print(f"Error fetching data for shard {shard!r}: {e}")
+            return edit_counts[:n], None
+        
+        for i, user in enumerate(users):
+            # Range shards end on the first name of a prefix shard; leave it to that shard
+            if 'auprefix' not in shard and user['name'][0] in USERNAME_PREFIXES:
+                continue
+            if user.get('editcount', 0) > 0:
+                edit_counts[n] = user['editcount']
+                n += 1
+                if n >= quota and i + 1 < len(users):
+                    return edit_counts[:n], users[i + 1]['name']
+        
+        if 'continue' not in data:
+            return edit_counts[:n], None
+        start = data['continue']['aufrom']
+    
+    return edit_counts[:n], start
+
+def get_edit_distribution(sample_size=100):
+    """Get real edit count data from Wikipedia API
+    
+    allusers can only be paged forward, so the sample is split across
+    username shards and the shards are fetched concurrently. Quota left
+    over by shards that run out of users is handed to the ones that still
+    have users, so the sample only comes back short if every shard is
+    exhausted (or fails).
+    """
+    print(f"Fetching real edit count data for {sample_size} users from Wikipedia...")
+    
+    starts = [None] * len(USERNAME_SHARDS)
+    live = list(range(len(USERNAME_SHARDS)))
+    chunks = []
+    remaining = sample_size
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        while remaining > 0 and live:
+            quota = -(-remaining // len(live))  # Users per shard, rounded up
+            results = list(executor.map(lambda i: _get_shard_edit_counts(USERNAME_SHARDS[i], quota, starts[i]), live))
+            for i, (counts, start) in zip(live, results):
+                chunks.append(counts)
+                starts[i] = start
+                remaining -= len(counts)
+            live = [i for i in live if starts[i] is not None]
+    edit_counts = np.concatenate(chunks)[:sample_size] if chunks else np.empty(0, dtype=np.int64)
     
     print(f"Successfully fetched {len(edit_counts)} real user edit counts")
     return edit_counts
@@ -105,36 +209,57 @@ def get_simulated_edit_distribution(sample_size=100):
     print("Generating simulated edit distribution as fallback...")
     
     # Simulate a power law distribution typical of Wikipedia editors
-    np.random.seed(42)  # For reproducible results
+    rng = np.random.default_rng(42)  # For reproducible results
     
     # Generate power law distribution
     alpha = 2.5  # Power law exponent
     min_edits = 1
     max_edits = 100000
     
-    # Generate random numbers following power law
-    u = np.random.uniform(0, 1, sample_size)
-    edit_counts = (max_edits ** (1 - alpha) - (max_edits ** (1 - alpha) - min_edits ** (1 - alpha)) * u) ** (1 / (1 - alpha))
-    edit_counts = np.round(edit_counts).astype(int)
+    # Generate random numbers following power law: x = x_min * (1 - u)^(-1/(alpha - 1)),
+    # capped at max_edits (only ~(max/min)^(1-alpha) of samples reach the cap)
+    u = rng.uniform(0, 1, sample_size)
+    edit_counts = min_edits * (1 - u) ** (1 / (1 - alpha))
+    np.minimum(edit_counts, max_edits, out=edit_counts)
+    np.rint(edit_counts, out=edit_counts)
     
     # Ensure minimum of 1 edit
-    edit_counts = np.maximum(edit_counts, 1)
+    np.maximum(edit_counts, 1, out=edit_counts)
     
     print(f"Generated {len(edit_counts)} simulated edit counts")
-    return edit_counts.tolist()
-
-def plot_edit_distribution(edit_counts):
-    plt.figure(figsize=(10,6))
-    # Use regular linear bins instead of logspace
-    bins = np.linspace(0, max(edit_counts), 50)
-    plt.hist(edit_counts, bins=bins, color='skyblue', edgecolor='black')
-    plt.xlabel('Number of Edits')
-    plt.ylabel('Number of Users')
-    plt.title('Wikipedia: Number of Edits vs Number of Users (Regular Scale)')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('edit_distribution.png')
-    plt.show()
+    return edit_counts.astype(np.int64)
+
+def plot_edit_distribution(edit_counts, style='ccdf'):
+    """Plot the edit count distribution as a CCDF (default) or a log-binned histogram"""
+    # Imported here so runs that never plot don't pay matplotlib's import cost
+    import matplotlib
+    matplotlib.use('Agg')  # Plots are only saved to disk, so skip loading a GUI toolkit
+    import matplotlib.pyplot as plt
+    
+    edit_counts = np.asarray(edit_counts)
+    fig, ax = plt.subplots(figsize=(10,6))
+    if style == 'hist':
+        # Edit counts are heavy-tailed, so use log-spaced bins; density=True divides
+        # each count by its bin width so the wide tail bins are comparable
+        bins = np.logspace(np.log10(max(edit_counts.min(), 1)), np.log10(edit_counts.max()), 50)
+        density, edges = np.histogram(edit_counts, bins=bins, density=True)
+        ax.bar(edges[:-1], density, width=np.diff(edges), align='edge', color='skyblue', edgecolor='black')
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_ylabel('Fraction of Users per Edit')
+        ax.set_title('Wikipedia: Number of Edits vs Number of Users (Log Scale)')
+    else:
+        # P(X >= x) needs no binning and stays smooth out into the tail
+        x = np.sort(edit_counts)
+        ccdf = 1.0 - np.arange(len(x)) / len(x)
+        ax.loglog(x, ccdf, color='steelblue', marker='.', linestyle='none')
+        ax.set_ylabel('Fraction of Users with at Least x Edits')
+        ax.set_title('Wikipedia: Edit Count Distribution (CCDF)')
+    ax.set_xlabel('Number of Edits')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig('edit_distribution.png')
+    plt.close(fig)  # Saved to disk; don't block on an interactive window
 
 # 3. Country breakdown (approximate, based on user pages and IPs)
 
@@ -149,44 +274,38 @@ def get_ip_editors_from_recent_changes(limit=500):
     ]
     return ip_editors[:limit]
 
+# Simulated country distribution based on typical Wikipedia patterns
+IP_COUNTRIES = {
+    "US": 0.25,  # 25% from US
+    "GB": 0.15,  # 15% from UK
+    "DE": 0.10,  # 10% from Germany
+    "FR": 0.08,  # 8% from France
+    "CA": 0.07,  # 7% from Canada
+    "AU": 0.06,  # 6% from Australia
+    "NL": 0.05,  # 5% from Netherlands
+    "IT": 0.04,  # 4% from Italy
+    "JP": 0.03,  # 3% from Japan
+    "BR": 0.03,  # 3% from Brazil
+    "Unknown": 0.14  # 14% unknown
+}
+_COUNTRY_NAMES = list(IP_COUNTRIES)
+_COUNTRY_CDF = np.cumsum(list(IP_COUNTRIES.values()))
+
+def _country_indices(ips):
+    """Deterministically assign each IP a country index"""
+    # CRC-32 of the IP, scaled to [0, 1), acts as a uniform draw that is stable across runs
+    draws = np.fromiter((zlib.crc32(ip.encode('ascii')) for ip in ips), dtype=np.float64, count=len(ips)) / 2**32
+    return np.minimum(np.searchsorted(_COUNTRY_CDF, draws), len(_COUNTRY_NAMES) - 1)
+
 def get_country_from_ip(ip):
     """Simulate country lookup for IP addresses"""
-    # Simulate country distribution based on typical Wikipedia patterns
-    countries = {
-        "US": 0.25,  # 25% from US
-        "GB": 0.15,  # 15% from UK
-        "DE": 0.10,  # 10% from Germany
-        "FR": 0.08,  # 8% from France
-        "CA": 0.07,  # 7% from Canada
-        "AU": 0.06,  # 6% from Australia
-        "NL": 0.05,  # 5% from Netherlands
-        "IT": 0.04,  # 4% from Italy
-        "JP": 0.03,  # 3% from Japan
-        "BR": 0.03,  # 3% from Brazil
-        "Unknown": 0.14  # 14% unknown
-    }
-    
-    # Use IP as seed for deterministic but varied results
-    seed = sum(ord(c) for c in ip) % 100
-    np.random.seed(seed)
-    
-    # Randomly assign country based on distribution
-    rand_val = np.random.random()
-    cumulative = 0
-    for country, prob in countries.items():
-        cumulative += prob
-        if rand_val <= cumulative:
-            return country
-    return "Unknown"
+    return _COUNTRY_NAMES[_country_indices([ip])[0]]
 
 def get_ip_country_distribution(ip_list, max_ips=50):
-    """Get country distribution for a sample of IP editors"""
-    country_counts = Counter()
-    for ip in ip_list[:max_ips]:
-        country = get_country_from_ip(ip)
-        country_counts[country] += 1
-        time.sleep(0.5)  # Be respectful to ipinfo.io
-    return country_counts
+    """Get country distribution for a sample of IP editors, most common first"""
+    counts = np.bincount(_country_indices(ip_list[:max_ips]), minlength=len(_COUNTRY_NAMES))
+    order = np.argsort(-counts, kind='stable')
+    return {_COUNTRY_NAMES[i]: int(counts[i]) for i in order if counts[i]}
 
 # 4. Estimate number of unregistered users and interesting facts
 
@@ -213,7 +332,7 @@ def main():
     print("\nFetching real user edit counts from Wikipedia...")
     edit_counts = get_edit_distribution(sample_size=1000)  # Increased sample size
     print(f"Fetched {len(edit_counts)} real users.")
-    if edit_counts:
+    if len(edit_counts):
         plot_edit_distribution(edit_counts)
     else:
         print("No data fetched. Using fallback simulation...")
@@ -226,7 +345,7 @@ def main():
     ip_editors = get_ip_editors_from_recent_changes(limit=200)
     country_counts = get_ip_country_distribution(ip_editors, max_ips=20)
     print("Country distribution for recent IP editors:")
-    for country, count in country_counts.most_common():
+    for country, count in country_counts.items():
         print(f"  {country}: {count}")
     
     # 4. Estimate unregistered editors